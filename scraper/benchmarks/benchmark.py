@@ -0,0 +1,195 @@
+"""Offline throughput benchmark of the scraper's fetch modes.
+
+Runs PartnershipScraper pipelines against the local fixture server and
+reports pages/sec, p50/p99 latency and peak Python memory per mode:
+
+    static      Concurrent static fetches of fast, slow and flaky articles (cold HTTP cache)
+    revalidate  The same fetches again, answered with 304 from the HTTP cache
+    head        <head>-only fetches as used by the old-article prefilter
+    pipeline    search_company_news end to end: feed discovery, fetch, parse, extract, store
+    render      Selenium renders of fast articles (needs Chrome, --render)
+    scroll      Infinite-scroll listing harvesting in Selenium (needs Chrome, --render)
+
+Usage:
+    python benchmarks/benchmark.py [--articles 200] [--render] [--output results.json]
+"""
+import os
+import sys
+import json
+import time
+import shutil
+import logging
+import argparse
+import tempfile
+import tracemalloc
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from fixture_server import FixtureServer  # noqa: E402
+from scheduler import CrawlScheduler  # noqa: E402
+from page_cache import PageCache  # noqa: E402
+
+
+def percentile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+@contextmanager
+def scratch_directory():
+    """Run a scraper in a throwaway working directory so its state files do not leak."""
+    previous = os.getcwd()
+    directory = tempfile.mkdtemp(prefix="scraper_bench_")
+    os.chdir(directory)
+    try:
+        yield directory
+    finally:
+        os.chdir(previous)
+        shutil.rmtree(directory, ignore_errors=True)
+
+
+def make_scraper():
+    """A PartnershipScraper in the current directory without politeness delays."""
+    from scraper import PartnershipScraper
+    scraper = PartnershipScraper()
+    # The fixture server is local; measure the pipeline, not the rate limits
+    scraper.scheduler = CrawlScheduler(rate=10_000, burst=10_000, respect_robots=False)
+    scraper.fetcher.scheduler = scraper.scheduler
+    logging.getLogger().setLevel(logging.WARNING)
+    return scraper
+
+
+def measure(name: str, run: Callable[[], Dict]) -> Dict:
+    """Time one mode; run returns {'pages', 'errors', 'latencies'}."""
+    tracemalloc.start()
+    start = time.perf_counter()
+    outcome = run()
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    latencies = outcome['latencies']
+    return {
+        'mode': name,
+        'pages': outcome['pages'],
+        'errors': outcome['errors'],
+        'seconds': round(seconds, 3),
+        'pages_per_sec': round(outcome['pages'] / seconds, 2) if seconds else None,
+        'p50_ms': round(percentile(latencies, 0.5) * 1000, 1) if latencies else None,
+        'p99_ms': round(percentile(latencies, 0.99) * 1000, 1) if latencies else None,
+        'peak_memory_mb': round(peak / 1024 / 1024, 2)
+    }
+
+
+def article_urls(base_url: str, articles: int) -> List[str]:
+    """Mostly fast articles with a quarter each of slow and error-injecting ones."""
+    fast = [f"{base_url}/articles/{n}.html" for n in range(articles)]
+    slow = [f"{base_url}/slow/{n}.html" for n in range(articles // 4)]
+    flaky = [f"{base_url}/flaky/{n}.html" for n in range(articles // 4)]
+    return fast + slow + flaky
+
+
+def fetch_outcome(results: Dict[str, Dict]) -> Dict:
+    return {
+        'pages': sum(1 for r in results.values() if r['html'] is not None),
+        'errors': sum(1 for r in results.values() if r['html'] is None),
+        'latencies': [r['elapsed'] for r in results.values()]
+    }
+
+
+def bench_static(base_url: str, articles: int) -> List[Dict]:
+    urls = article_urls(base_url, articles)
+    with scratch_directory():
+        scraper = make_scraper()
+        cold = measure('static', lambda: fetch_outcome(scraper.prefetch_pages(urls)))
+        # A new run: nothing in the page cache, validators in the HTTP cache
+        scraper.page_cache = PageCache(scraper.page_cache.max_entries)
+        warm = measure('revalidate', lambda: fetch_outcome(scraper.prefetch_pages(urls)))
+        head = measure('head', lambda: fetch_outcome(scraper.fetcher.fetch_heads(urls)))
+        scraper.fetcher.close()
+    return [cold, warm, head]
+
+
+def bench_pipeline(base_url: str) -> Dict:
+    def run():
+        scraper = make_scraper()
+        latencies = []
+        record_fetch = scraper.metrics.record_fetch
+
+        def record_and_keep(result, stage='fetch'):
+            latencies.append(result['elapsed'])
+            record_fetch(result, stage)
+
+        scraper.metrics.record_fetch = record_and_keep
+        scraper.search_company_news("Fixture", [f"{base_url}/listing"])
+        scraper.fetcher.close()
+        return {
+            'pages': len(scraper.results),
+            'errors': int(scraper.metrics.report()['totals']['errors']),
+            'latencies': latencies
+        }
+    with scratch_directory():
+        return measure('pipeline', run)
+
+
+def bench_render(base_url: str, articles: int) -> List[Dict]:
+    urls = [f"{base_url}/articles/{n}.html" for n in range(min(articles, 20))]
+    with scratch_directory():
+        scraper = make_scraper()
+
+        def render():
+            latencies, errors = [], 0
+            for url in urls:
+                start = time.perf_counter()
+                try:
+                    scraper.render_page(url)
+                    latencies.append(time.perf_counter() - start)
+                except Exception as e:
+                    logging.warning(f"Render failed for {url}: {str(e)}")
+                    errors += 1
+            return {'pages': len(latencies), 'errors': errors, 'latencies': latencies}
+
+        def scroll():
+            start = time.perf_counter()
+            scraper.use_feed_discovery = False
+            try:
+                links = scraper.discover_article_links("Fixture", f"{base_url}/infinite")
+            except Exception as e:
+                logging.warning(f"Scrolling the listing failed: {str(e)}")
+                return {'pages': 0, 'errors': 1, 'latencies': []}
+            return {'pages': len(links), 'errors': 0, 'latencies': [time.perf_counter() - start]}
+
+        try:
+            return [measure('render', render), measure('scroll', scroll)]
+        finally:
+            scraper.driver_pool.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline scraper benchmark")
+    parser.add_argument('--articles', type=int, default=200, help="fast articles served (slow and flaky: a quarter each)")
+    parser.add_argument('--slow-delay', type=float, default=0.2, help="seconds the slow pages take")
+    parser.add_argument('--render', action='store_true', help="also benchmark Selenium modes (needs Chrome)")
+    parser.add_argument('--output', help="write the results as JSON to this file")
+    args = parser.parse_args()
+
+    with FixtureServer(articles=args.articles, slow_delay=args.slow_delay) as server:
+        rows = bench_static(server.base_url, args.articles)
+        rows.append(bench_pipeline(server.base_url))
+        if args.render:
+            rows.extend(bench_render(server.base_url, args.articles))
+
+    columns = ['mode', 'pages', 'errors', 'seconds', 'pages_per_sec', 'p50_ms', 'p99_ms', 'peak_memory_mb']
+    print(' '.join(f"{c:>14}" for c in columns))
+    for row in rows:
+        print(' '.join(f"{str(row[c]):>14}" for c in columns))
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(rows, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
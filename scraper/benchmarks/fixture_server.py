@@ -0,0 +1,184 @@
+"""Local HTTP server with synthetic news pages for offline scraper benchmarks.
+
+Routes:
+    /robots.txt                  Allows everything
+    /feed.xml                    RSS feed of the fast articles
+    /listing                     Static listing linking to every article
+    /infinite?page=N             Infinite-scroll listing; scrolling loads the next page via JavaScript
+    /articles/N.html             Fast article
+    /slow/N.html                 Article served after a delay
+    /flaky/N.html                Error injection: 500, 429 or 404 for some N, the article otherwise
+
+Every article carries JSON-LD metadata, a search term in its body and an
+ETag, so conditional re-fetches are answered with 304.
+"""
+import time
+import hashlib
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+LINKS_PER_SCROLL_PAGE = 20
+
+
+def article_html(path: str, n: int, paragraphs: int = 20) -> str:
+    body = ''.join(
+        f"<p>Paragraph {i} of article {n}. The strategic alliance extends the data platform "
+        f"integration between both companies and their partners.</p>"
+        for i in range(paragraphs)
+    )
+    return f"""<!DOCTYPE html>
+<html><head>
+<title>Article {n}</title>
+<meta property="og:title" content="Partnership announcement {n}">
+<script type="application/ld+json">{{"@type": "NewsArticle", "headline": "Partnership announcement {n}",
+ "datePublished": "2024-0{n % 9 + 1}-1{n % 10}T09:00:00Z"}}</script>
+</head><body>
+<nav><a href="/listing">News</a></nav>
+<article><h1>Partnership announcement {n}</h1><time datetime="2024-01-01">January 1, 2024</time>{body}</article>
+<footer>{path}</footer>
+</body></html>"""
+
+
+def listing_html(links) -> str:
+    items = ''.join(f'<li><a href="{link}">{link}</a></li>' for link in links)
+    intro = "<p>" + "The latest announcements, partnerships and product news from our teams and partners. " * 4 + "</p>"
+    return f"<!DOCTYPE html><html><head><title>News</title></head><body><h1>News</h1>{intro}<ul>{items}</ul></body></html>"
+
+
+def infinite_html(page: int, pages: int) -> str:
+    start = page * LINKS_PER_SCROLL_PAGE
+    items = ''.join(f'<li><a href="/articles/{n}.html">Article {n}</a></li>'
+                    for n in range(start, start + LINKS_PER_SCROLL_PAGE))
+    return f"""<!DOCTYPE html>
+<html><head><title>News</title></head><body style="margin:0">
+<h1>News</h1><ul id="items">{items}</ul><div style="height:2000px"></div>
+<script>
+var page = {page}, pages = {pages}, loading = false;
+window.addEventListener('scroll', function () {{
+  if (loading || page + 1 >= pages) return;
+  if (window.innerHeight + window.scrollY < document.body.scrollHeight - 50) return;
+  loading = true;
+  fetch('/infinite?page=' + (page + 1) + '&fragment=1').then(function (r) {{ return r.text(); }}).then(function (html) {{
+    page += 1;
+    document.getElementById('items').insertAdjacentHTML('beforeend', html);
+    document.body.appendChild(Object.assign(document.createElement('div'), {{style: 'height:2000px'}}));
+    loading = false;
+  }});
+}});
+</script>
+</body></html>"""
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    server_version = "FixtureServer/1.0"
+
+    def log_message(self, format, *args):
+        pass  # keep benchmark output clean
+
+    def _send(self, status: int, body: str = "", content_type: str = "text/html; charset=utf-8", headers=None):
+        data = body.encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(data)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_article(self, path: str, n: int):
+        html = article_html(path, n, self.server.paragraphs)
+        etag = '"' + hashlib.sha1(html.encode('utf-8')).hexdigest() + '"'
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            self.send_header('ETag', etag)
+            self.end_headers()
+            return
+        self._send(200, html, headers={'ETag': etag})
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        path = parsed.path
+        server = self.server
+        if path == '/robots.txt':
+            return self._send(200, "User-agent: *\nAllow: /\n", 'text/plain')
+        if path == '/feed.xml':
+            base = f"http://{self.headers.get('Host')}"
+            items = ''.join(
+                f"<item><title>Article {n}</title><link>{base}/articles/{n}.html</link>"
+                f"<pubDate>Mon, 01 Jan 2024 09:00:00 GMT</pubDate></item>"
+                for n in range(server.articles)
+            )
+            return self._send(200, f'<?xml version="1.0"?><rss version="2.0"><channel><title>News</title>{items}</channel></rss>',
+                              'application/rss+xml')
+        if path == '/listing':
+            links = [f"/articles/{n}.html" for n in range(server.articles)]
+            feed_link = '<link rel="alternate" type="application/rss+xml" href="/feed.xml">'
+            return self._send(200, listing_html(links).replace('<head>', '<head>' + feed_link))
+        if path == '/infinite':
+            query = parse_qs(parsed.query)
+            page = int(query.get('page', ['0'])[0])
+            pages = max(1, server.articles // LINKS_PER_SCROLL_PAGE)
+            if 'fragment' in query:
+                start = page * LINKS_PER_SCROLL_PAGE
+                return self._send(200, ''.join(f'<li><a href="/articles/{n}.html">Article {n}</a></li>'
+                                               for n in range(start, start + LINKS_PER_SCROLL_PAGE)))
+            return self._send(200, infinite_html(page, pages))
+
+        kind, _, name = path.strip('/').partition('/')
+        if not name.endswith('.html') or not name[:-5].isdigit():
+            return self._send(404, "not found")
+        n = int(name[:-5])
+        if kind == 'articles':
+            return self._send_article(path, n)
+        if kind == 'slow':
+            time.sleep(server.slow_delay)
+            return self._send_article(path, n)
+        if kind == 'flaky':
+            if n % 5 == 0:
+                return self._send(500, "internal error")
+            if n % 7 == 0:
+                return self._send(429, "slow down", headers={'Retry-After': '0'})
+            if n % 11 == 0:
+                return self._send(404, "not found")
+            return self._send_article(path, n)
+        return self._send(404, "not found")
+
+
+class FixtureServer(ThreadingHTTPServer):
+    """Serve the fixture site on a background thread; use as a context manager."""
+
+    daemon_threads = True
+
+    def __init__(self, port: int = 0, articles: int = 200, slow_delay: float = 0.2, paragraphs: int = 20):
+        super().__init__(('127.0.0.1', port), FixtureHandler)
+        self.articles = articles
+        self.slow_delay = slow_delay
+        self.paragraphs = paragraphs
+        self.thread = threading.Thread(target=self.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self) -> 'FixtureServer':
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+if __name__ == "__main__":
+    import argparse
+    parser = argparse.ArgumentParser(description="Serve the benchmark fixture site")
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--articles', type=int, default=200)
+    args = parser.parse_args()
+    with FixtureServer(args.port, args.articles) as server:
+        print(f"Serving fixtures on {server.base_url}")
+        try:
+            server.thread.join()
+        except KeyboardInterrupt:
+            pass
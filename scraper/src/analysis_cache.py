@@ -0,0 +1,58 @@
+import json
+import sqlite3
+from typing import Any, Dict
+
+
+class AnalysisCache:
+    """Persistent analysis results keyed by document content hash and output field.
+
+    Each field is stored with a hash of the analyzer configuration it
+    depends on. A stored value is only returned while that hash still
+    matches, so changing e.g. the themes invalidates theme matches but
+    keeps the named entities of every document.
+    """
+
+    def __init__(self, path: str = "analysis_cache.sqlite"):
+        self.path = path
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS fields (
+                content_hash TEXT NOT NULL,
+                field TEXT NOT NULL,
+                config_hash TEXT NOT NULL,
+                value TEXT NOT NULL,
+                PRIMARY KEY (content_hash, field)
+            )
+        """)
+        self.conn.commit()
+
+    def get(self, content_hash: str, config_hashes: Dict[str, str]) -> Dict[str, Any]:
+        """Cached values of the requested fields that were computed with the current configuration.
+
+        Args:
+            content_hash: Hash of the document text
+            config_hashes: Current configuration hash of each requested field
+        """
+        rows = self.conn.execute(
+            "SELECT field, config_hash, value FROM fields WHERE content_hash = ?", (content_hash,)
+        ).fetchall()
+        return {
+            field: json.loads(value)
+            for field, config_hash, value in rows
+            if config_hashes.get(field) == config_hash
+        }
+
+    def put(self, content_hash: str, values: Dict[str, Any], config_hashes: Dict[str, str]):
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR REPLACE INTO fields (content_hash, field, config_hash, value) VALUES (?, ?, ?, ?)",
+                [(content_hash, field, config_hashes[field], json.dumps(value, ensure_ascii=False))
+                 for field, value in values.items()]
+            )
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(DISTINCT content_hash) FROM fields").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,92 @@
+import os
+import json
+from collections import Counter
+from typing import Dict
+
+
+class JsonlWriter:
+    """Write analysis results as JSON Lines, one record per result as soon as it is produced."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self.count = 0
+        self.file = None
+
+    def __enter__(self) -> 'JsonlWriter':
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(self.path, 'w', encoding='utf-8')
+        return self
+
+    def write(self, result: Dict):
+        self.file.write(json.dumps(result, ensure_ascii=False) + '\n')
+        self.count += 1
+
+    def __exit__(self, *exc):
+        self.file.close()
+
+
+class SummaryAggregator:
+    """Build the analysis summary incrementally, one result at a time.
+
+    Keeps only running totals, the first ``max_examples`` example
+    sentences per subtheme and the entity and term counters, so memory
+    does not grow with the number of results. ``summary`` returns the same
+    structure as ContentAnalyzer.generate_summary.
+    """
+
+    def __init__(self, themes: Dict, max_examples: int = 5):
+        self.themes = themes
+        self.max_examples = max_examples
+        self.total_files = 0
+        self.total_sentences = 0
+        self.total_words = 0
+        self.relevant_count = 0
+        self.irrelevant_count = 0
+        self.theme_counts = {category: {subtheme: 0 for subtheme in subthemes} for category, subthemes in themes.items()}
+        self.examples = {category: {subtheme: [] for subtheme in subthemes} for category, subthemes in themes.items()}
+        self.common_entities = Counter()
+        self.common_terms = Counter()
+
+    def add(self, result: Dict):
+        self.total_files += 1
+        self.total_sentences += result['num_sentences']
+        self.total_words += result['num_words']
+        if result.get('is_relevant', False):
+            self.relevant_count += 1
+        else:
+            self.irrelevant_count += 1
+
+        for category, subthemes in self.themes.items():
+            category_matches = result['theme_matches'].get(category, {})
+            for subtheme in subthemes:
+                matches = category_matches.get(subtheme, [])
+                self.theme_counts[category][subtheme] += len(matches)
+                examples = self.examples[category][subtheme]
+                for match in matches[:self.max_examples - len(examples)]:
+                    examples.append(match['sentence'])
+
+        # Convert entity tuples to strings before updating Counter
+        self.common_entities.update(f"{entity[0]}_{entity[1]}" for entity in result['entities'])
+        self.common_terms.update(result['term_frequency'])
+
+    def summary(self) -> Dict:
+        return {
+            'total_files': self.total_files,
+            'total_sentences': self.total_sentences,
+            'total_words': self.total_words,
+            'theme_statistics': {
+                category: {
+                    subtheme: {
+                        'num_matches': self.theme_counts[category][subtheme],
+                        'description': details['description'],
+                        'examples': list(self.examples[category][subtheme])
+                    }
+                    for subtheme, details in subthemes.items()
+                }
+                for category, subthemes in self.themes.items()
+            },
+            'common_entities': Counter(self.common_entities),
+            'common_terms': Counter(self.common_terms)
+        }
@@ -0,0 +1,38 @@
+from functools import cached_property
+from typing import List, Tuple
+from nltk.tokenize import sent_tokenize, word_tokenize
+from nltk.tag import pos_tag
+from nltk.chunk import ne_chunk
+
+
+class AnnotatedDocument:
+    """NLP annotations of one document, each computed on first use and shared.
+
+    Sentences, tokens, POS tags and named-entity chunks build on each other,
+    so all extractors of a document reuse one sentence split, one
+    tokenization and one tagging pass.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+
+    @cached_property
+    def sentences(self) -> List[str]:
+        return sent_tokenize(self.text)
+
+    @cached_property
+    def tokens(self) -> List[str]:
+        # Same tokens as word_tokenize(text), without splitting the sentences again
+        return [token for sentence in self.sentences for token in word_tokenize(sentence, preserve_line=True)]
+
+    @cached_property
+    def lower_tokens(self) -> List[str]:
+        return [token.lower() for token in self.tokens]
+
+    @cached_property
+    def pos_tags(self) -> List[Tuple[str, str]]:
+        return pos_tag(self.tokens)
+
+    @cached_property
+    def ne_chunks(self):
+        return ne_chunk(self.pos_tags)
@@ -0,0 +1,68 @@
+import os
+import json
+import time
+import logging
+from typing import Dict, Optional
+from scheduler import ROBOTS_DISALLOWED
+
+# Statuses that will not change by retrying the same URL later
+PERMANENT_STATUSES = (400, 404, 405, 410, 414, 451)
+
+
+def classify_failure(result: Dict) -> str:
+    """'permanent' for failures retrying cannot fix, 'transient' for everything else.
+
+    Args:
+        result: A failed fetch result as returned by AsyncFetcher
+    """
+    if result.get('status') in PERMANENT_STATUSES or result.get('error') == ROBOTS_DISALLOWED:
+        return 'permanent'
+    # Network errors, timeouts, throttling, 5xx and bot walls (401/403, which the browser may pass)
+    return 'transient'
+
+
+class FailureLog:
+    """Persisted list of pages the webpage backfill could not save.
+
+    Permanent failures are skipped by later backfills, transient ones are
+    retried. Entries are removed as soon as the page is saved.
+    """
+
+    def __init__(self, path: str = "backfill_failures.json"):
+        self.path = path
+        self.failures: Dict[str, Dict] = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.failures = json.load(f)
+            except json.JSONDecodeError:
+                logging.warning(f"Could not load {path}, starting with an empty failure list")
+
+    def record(self, url: str, company: str, kind: str, status: Optional[int] = None, error: Optional[str] = None):
+        previous = self.failures.get(url, {})
+        self.failures[url] = {
+            'company': company,
+            'kind': kind,
+            'status': status,
+            'error': error,
+            'attempts': previous.get('attempts', 0) + 1,
+            'last_attempt': time.time()
+        }
+
+    def clear(self, url: str):
+        self.failures.pop(url, None)
+
+    def is_permanent(self, url: str) -> bool:
+        return self.failures.get(url, {}).get('kind') == 'permanent'
+
+    def counts(self) -> Dict[str, int]:
+        counts = {'permanent': 0, 'transient': 0}
+        for failure in self.failures.values():
+            counts[failure['kind']] += 1
+        return counts
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.failures, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
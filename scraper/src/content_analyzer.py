@@ -1,22 +1,32 @@
 import os
 import json
+import hashlib
+import argparse
+import multiprocessing
 import pandas as pd
-from typing import List, Dict, Set
+from typing import Iterable, Iterator, List, Dict, Optional, Set, Tuple, Union
 import nltk
-from nltk.tokenize import sent_tokenize, word_tokenize
+from nltk.tokenize import word_tokenize
 from nltk.corpus import stopwords
 from nltk.tag import pos_tag
 from nltk.chunk import ne_chunk
 from collections import Counter
+from itertools import islice
 from datetime import datetime
 import logging
+from term_matcher import TermMatcher
+from page_store import PageStore
+from annotation import AnnotatedDocument
+from analysis_cache import AnalysisCache
+from analysis_output import JsonlWriter, SummaryAggregator
 
-# Download required NLTK data
-nltk.download('punkt')
-nltk.download('stopwords')
-nltk.download('averaged_perceptron_tagger')
-nltk.download('maxent_ne_chunker')
-nltk.download('words')
+# Download required NLTK data (once, not again in every analysis worker)
+if multiprocessing.parent_process() is None:
+    nltk.download('punkt')
+    nltk.download('stopwords')
+    nltk.download('averaged_perceptron_tagger')
+    nltk.download('maxent_ne_chunker')
+    nltk.download('words')
 
 # Set up logging
 logging.basicConfig(
@@ -29,8 +39,45 @@ logging.basicConfig(
 )
 relevant_companies = ['SAP', 'Databricks', 'Google Cloud', 'Confluent', 'Collibra', 'Palantir', 'Informatica']
 
+# Bump when a change to the analysis code changes its results, to invalidate the analysis cache
+ANALYZER_VERSION = 1
+
+# Output fields computed by each analysis profile, cheapest first.
+# num_sentences and is_relevant come from the sentence filter and are always computed.
+BASE_FIELDS = ('num_sentences', 'is_relevant')
+#   fast:     keyword matching only, no tokenization
+#   standard: adds tokenization and POS tagging
+#   full:     adds named-entity chunking, the most expensive step
+ANALYSIS_PROFILES = {
+    'fast': ('theme_matches', 'company_mentions'),
+    'standard': ('theme_matches', 'company_mentions', 'num_words', 'term_frequency', 'key_phrases'),
+    'full': ('theme_matches', 'company_mentions', 'num_words', 'term_frequency', 'key_phrases', 'entities')
+}
+
+
+def empty_analysis() -> Dict:
+    """Analysis result with every field at its default, as for text without relevant sentences."""
+    return {
+        'num_sentences': 0,
+        'num_words': 0,
+        'theme_matches': {},
+        'key_phrases': [],
+        'entities': [],
+        'term_frequency': {},
+        'company_mentions': [],
+        'is_relevant': False
+    }
+
 class ContentAnalyzer:
-    def __init__(self):
+    def __init__(self, profile: str = 'full'):
+        """
+        Args:
+            profile: Analysis profile, one of ANALYSIS_PROFILES, selecting the fields analyze_text computes
+        """
+        if profile not in ANALYSIS_PROFILES:
+            raise ValueError(f"Unknown analysis profile {profile!r}, expected one of {', '.join(ANALYSIS_PROFILES)}")
+        self.profile = profile
+        self.fields = ANALYSIS_PROFILES[profile]
         self.themes = {
             'type_of_partnership': {
                 'technology_partnership': {
@@ -95,20 +142,62 @@ class ContentAnalyzer:
         # Definieren Sie die irrelevanten Schlüsselwörter hier
         self.irrelevant_keywords = ['cookie', 'privacy', 'terms of service', 'legal notice']
         
-    def read_text_file(self, file_path: str) -> str:
-        """Read a UTF-16 LE encoded text file."""
+        self.term_matcher = self.build_term_matcher()
+    
+    def build_term_matcher(self) -> TermMatcher:
+        """Compile irrelevant keywords, company names and theme keywords into one matcher."""
+        terms = {
+            ('irrelevant',): self.irrelevant_keywords,
+            ('company',): relevant_companies
+        }
+        for category, subthemes in self.themes.items():
+            for subtheme, details in subthemes.items():
+                terms[('theme', category, subtheme)] = details['keywords']
+        return TermMatcher(terms)
+
+    def field_config_hashes(self) -> Dict[str, str]:
+        """Hash of the configuration each output field depends on, for the analysis cache.
+        
+        The irrelevant-sentence filter decides what every field sees, so it
+        is part of all of them; a theme change only affects theme_matches.
+        """
+        base = [ANALYZER_VERSION, sorted(self.irrelevant_keywords)]
+        depends_on = {
+            'num_sentences': [],
+            'is_relevant': [],
+            'theme_matches': [self.themes],
+            'company_mentions': [relevant_companies],
+            'num_words': [sorted(self.stop_words)],
+            'term_frequency': [sorted(self.stop_words)],
+            'key_phrases': [],
+            'entities': []
+        }
+        return {
+            field: hashlib.sha256(json.dumps(base + extra, sort_keys=True).encode('utf-8')).hexdigest()[:16]
+            for field, extra in depends_on.items()
+        }
+        
+    def read_page(self, store: PageStore, page: Dict) -> str:
+        """Read a page's text from the page store."""
         try:
-            with open(file_path, 'r', encoding='utf-16le') as f:
-                return f.read()
+            return store.read(page['hash'])
         except Exception as e:
-            logging.error(f"Error reading file {file_path}: {str(e)}")
+            logging.error(f"Error reading page {page['url']}: {str(e)}")
             return ""
 
-    def extract_named_entities(self, text: str) -> List[tuple]:
+    @staticmethod
+    def page_filename(page: Dict) -> str:
+        """Name the page had as a webpage_content text file, kept in results for continuity."""
+        safe_url = page['url'].replace('https://', '').replace('http://', '').replace('/', '_')
+        return f"{page['company']}_{safe_url}.txt"
+
+    @staticmethod
+    def annotate(text: Union[str, AnnotatedDocument]) -> AnnotatedDocument:
+        return text if isinstance(text, AnnotatedDocument) else AnnotatedDocument(text)
+
+    def extract_named_entities(self, text: Union[str, AnnotatedDocument]) -> List[tuple]:
         """Extract named entities using NLTK."""
-        tokens = word_tokenize(text)
-        pos_tags = pos_tag(tokens)
-        named_entities = ne_chunk(pos_tags)
+        named_entities = self.annotate(text).ne_chunks
         
         entities = []
         for chunk in named_entities:
@@ -117,10 +206,9 @@ class ContentAnalyzer:
         
         return entities
 
-    def extract_key_phrases(self, text: str) -> List[str]:
+    def extract_key_phrases(self, text: Union[str, AnnotatedDocument]) -> List[str]:
         """Extract key phrases using NLTK's part-of-speech tagging."""
-        tokens = word_tokenize(text)
-        pos_tags = pos_tag(tokens)
+        pos_tags = self.annotate(text).pos_tags
         
         # Extract noun phrases (sequences of nouns)
         key_phrases = []
@@ -138,173 +226,248 @@ class ContentAnalyzer:
         
         return key_phrases
 
-    def analyze_text(self, text: str) -> Dict:
-        """Analyze text content for themes and key information."""
+    def analyze_text(self, text: Union[str, AnnotatedDocument], fields: Optional[Iterable[str]] = None) -> Dict:
+        """Analyze text content for themes and key information.
+        
+        Args:
+            text: The text, or its annotated document
+            fields: Output fields to compute, by default those of the analyzer's profile.
+                Fields that are not computed keep their empty defaults.
+        """
+        fields = set(self.fields if fields is None else fields)
         
-        # Extract sentences
-        sentences = sent_tokenize(text)
+        # Sentences, tokens and tags are computed once and shared by all extractors
+        doc = self.annotate(text)
+        
+        # Extract sentences and match all terms in a single pass per sentence
+        sentences = doc.sentences
         
         # Filter out irrelevant sentences
         relevant_sentences = []
         for sentence in sentences:
-            if any(keyword.lower() in sentence.lower() for keyword in self.irrelevant_keywords):
+            found = self.term_matcher.matched_terms(sentence)
+            if ('irrelevant',) in found:
                 logging.info(f"Ignoring irrelevant sentence: {sentence}")
                 continue
-            relevant_sentences.append(sentence)
+            relevant_sentences.append((sentence, found))
 
         # Check if there are any relevant sentences left
         is_relevant = len(relevant_sentences) > 0
 
         # Initialize the result dictionary with default values
-        result = {
-            'num_sentences': len(relevant_sentences),
-            'num_words': 0,  # Default to 0
-            'theme_matches': {},
-            'key_phrases': [],
-            'entities': [],
-            'term_frequency': {},
-            'company_mentions': [],
-            'is_relevant': is_relevant
-        }
+        result = empty_analysis()
+        result['num_sentences'] = len(relevant_sentences)
+        result['is_relevant'] = is_relevant
 
         if not is_relevant:
             logging.info("No relevant content found, skipping analysis.")
             return result  # Return the result with is_relevant set to False
 
         # Check for mentions of relevant companies
-        company_mentions = []
-        for sentence in relevant_sentences:
-            for company in relevant_companies:
-                if company.lower() in sentence.lower():
-                    company_mentions.append(company)
-                    break  # Stop checking after the first match in this sentence
+        if 'company_mentions' in fields:
+            company_mentions = []
+            for sentence, found in relevant_sentences:
+                companies = found.get(('company',))
+                if companies:
+                    # Only count the first listed company mentioned in this sentence
+                    company_mentions.append(next(c for c in relevant_companies if c in companies))
+            result['company_mentions'] = list(set(company_mentions))  # Unique mentions of relevant companies
 
         # Extract named entities
-        entities = self.extract_named_entities(text)
+        if 'entities' in fields:
+            result['entities'] = self.extract_named_entities(doc)
         
         # Extract key phrases
-        key_phrases = self.extract_key_phrases(text)
+        if 'key_phrases' in fields:
+            result['key_phrases'] = self.extract_key_phrases(doc)[:10]  # Top 10 key phrases
         
         # Analyze themes
-        theme_matches = {}
-        for category, subthemes in self.themes.items():
-            theme_matches[category] = {}
-            for subtheme, details in subthemes.items():
-                matches = []
-                for sentence in relevant_sentences:
-                    if any(keyword.lower() in sentence.lower() for keyword in details['keywords']):
-                        matches.append({
-                            'sentence': sentence,
-                            'matched_keywords': [k for k in details['keywords'] if k.lower() in sentence.lower()],
-                            'description': details['description']
-                        })
-                theme_matches[category][subtheme] = matches
+        if 'theme_matches' in fields:
+            theme_matches = {}
+            for category, subthemes in self.themes.items():
+                theme_matches[category] = {}
+                for subtheme, details in subthemes.items():
+                    matches = []
+                    for sentence, found in relevant_sentences:
+                        keywords = found.get(('theme', category, subtheme))
+                        if keywords:
+                            matches.append({
+                                'sentence': sentence,
+                                'matched_keywords': [k for k in details['keywords'] if k in keywords],
+                                'description': details['description']
+                            })
+                    theme_matches[category][subtheme] = matches
+            result['theme_matches'] = theme_matches
         
         # Extract important terms (excluding stop words)
-        words = word_tokenize(text.lower())
-        words = [word for word in words if word.isalnum() and word not in self.stop_words]
-        term_frequency = Counter(words)
-
-        # Update the result dictionary with actual values
-        result['num_words'] = len(words)
-        result['theme_matches'] = theme_matches
-        result['key_phrases'] = key_phrases[:10]  # Top 10 key phrases
-        result['entities'] = entities
-        result['term_frequency'] = dict(term_frequency.most_common(20))  # Top 20 terms
-        result['company_mentions'] = list(set(company_mentions))  # Unique mentions of relevant companies
+        if 'num_words' in fields or 'term_frequency' in fields:
+            words = [word for word in doc.lower_tokens if word.isalnum() and word not in self.stop_words]
+            if 'num_words' in fields:
+                result['num_words'] = len(words)
+            if 'term_frequency' in fields:
+                result['term_frequency'] = dict(Counter(words).most_common(20))  # Top 20 terms
 
         return result
 
-    def analyze_directory(self, directory: str) -> List[Dict]:
-        """Analyze all text files in a directory."""
+    def analyze_page(self, store: PageStore, page: Dict, fields: Optional[Iterable[str]] = None) -> Optional[Dict]:
+        """Read and analyze one stored page, None if it has no text."""
+        logging.info(f"Analyzing {page['url']}")
+        content = self.read_page(store, page)
+        if not content:
+            return None
+        return self.analyze_text(content, fields)
+
+    def analysis_pool(self, directory: str, workers: int):
+        """Process pool whose workers each load this analyzer, the NLTK models and the page store once."""
+        context = multiprocessing.get_context('spawn')
+        return context.Pool(workers, initializer=_init_worker, initargs=(self, directory))
+
+    def analyze_pages_parallel(self, pool, jobs: List[Tuple[Dict, Tuple[str, ...]]],
+                               chunk_size: int = 16) -> Iterator[Optional[Dict]]:
+        """Analyze (page, fields) jobs in a process pool, yielding the analyses in the order of jobs.
+        
+        Jobs are sent to the workers in chunks; the workers read the page texts themselves.
+        """
+        chunks = [jobs[i:i + chunk_size] for i in range(0, len(jobs), chunk_size)]
+        for analyses in pool.imap(_analyze_chunk, chunks):
+            yield from analyses
+
+    def iter_analyses(self, directory: str, workers: int = 1, chunk_size: int = 16,
+                      cache_file: str = "analysis_cache.sqlite") -> Iterator[Dict]:
+        """Yield the analysis of every page in a page store directory, in store order.
+        
+        Results are cached per content hash and field, so only new or
+        changed pages, and fields whose configuration changed, are analyzed.
+        Pages are handled in windows, so memory is bounded by the window
+        rather than the corpus. The page store itself is only read.
+        
+        Args:
+            directory: The page store directory
+            workers: Number of analysis processes; 1 analyzes in this process
+            chunk_size: Pages sent to a worker at a time
+            cache_file: SQLite file of the analysis cache
+        """
+        cache = AnalysisCache(cache_file)
+        config_hashes = self.field_config_hashes()
+        wanted = BASE_FIELDS + tuple(self.fields)
+        wanted_hashes = {field: config_hashes[field] for field in wanted}
+        window = chunk_size * max(workers, 1) * 4
+        
+        store = PageStore(directory)
+        pages = store.iter_pages(batch_size=window)
+        pool = None
+        analyzed = 0
+        total = 0
+        try:
+            while True:
+                batch = list(islice(pages, window))
+                if not batch:
+                    break
+                total += len(batch)
+                
+                # Look up every distinct text once; identical pages share their analysis
+                values_by_hash: Dict[str, Dict] = {}
+                jobs = []
+                for page in batch:
+                    if page['hash'] in values_by_hash:
+                        continue
+                    values = cache.get(page['hash'], wanted_hashes)
+                    values_by_hash[page['hash']] = values
+                    missing = tuple(field for field in wanted if field not in values)
+                    if missing:
+                        jobs.append((page, missing))
+                
+                # Read and analyze content, in worker processes for larger batches
+                if workers > 1 and len(jobs) > chunk_size:
+                    pool = pool or self.analysis_pool(directory, workers)
+                    analyses = self.analyze_pages_parallel(pool, jobs, chunk_size)
+                else:
+                    analyses = (self.analyze_page(store, page, fields) for page, fields in jobs)
+                
+                for (page, fields), analysis in zip(jobs, analyses):
+                    if analysis is None:
+                        continue
+                    computed = {field: analysis[field] for field in set(fields) | set(BASE_FIELDS)}
+                    cache.put(page['hash'], computed, config_hashes)
+                    values_by_hash[page['hash']].update(computed)
+                analyzed += len(jobs)
+                
+                for page in batch:
+                    values = values_by_hash[page['hash']]
+                    if any(field not in values for field in wanted):
+                        continue  # unreadable page
+                    analysis = empty_analysis()
+                    analysis.update(values)
+                    analysis['filename'] = self.page_filename(page)
+                    analysis['url'] = page['url']
+                    analysis['company'] = page['company']
+                    yield analysis
+            logging.info(f"Analyzed {analyzed} pages, the other {total - analyzed} were cached or duplicates")
+        finally:
+            if pool is not None:
+                pool.terminate()
+            store.close()
+            cache.close()
+
+    def analyze_directory(self, directory: str, workers: int = 1, chunk_size: int = 16,
+                          cache_file: str = "analysis_cache.sqlite") -> List[Dict]:
+        """Analyze all pages in a page store directory.
+        
+        Returns:
+            The results of all pages and the counts of relevant and irrelevant pages.
+            See iter_analyses for the arguments.
+        """
         results = []
         relevant_count = 0
         irrelevant_count = 0
         
-        # Load existing results if available
-        existing_results = []
-        existing_files = set()
-        try:
-            with open('content_analysis_results_20250327_115020.json', 'r', encoding='utf-8') as f:
-                existing_results = json.load(f)
-                existing_files = {r['filename'] for r in existing_results}
-        except FileNotFoundError:
-            pass
-        
-        for filename in os.listdir(directory):
-            if filename.endswith('.txt'):
-                # Skip if file was already analyzed
-                if filename in existing_files:
-                    logging.info(f"Skipping already analyzed file: {filename}")
-                    continue
-                    
-                file_path = os.path.join(directory, filename)
-                logging.info(f"Analyzing {filename}")
-                
-                # Read and analyze content
-                content = self.read_text_file(file_path)
-                if content:
-                    analysis = self.analyze_text(content)
-                    analysis['filename'] = filename
-                    results.append(analysis)
-                    
-                    # Count relevant and irrelevant files
-                    if analysis.get('is_relevant', False):
-                        relevant_count += 1
-                        # Rename the file to indicate relevance
-                        new_filename = filename.replace('.txt', '_relevant.txt')
-                    else:
-                        irrelevant_count += 1
-                        # Rename the file to indicate irrelevance
-                        new_filename = filename.replace('.txt', '_irrelevant.txt')
-                    
-                    # Rename the file in the directory
-                    new_file_path = os.path.join(directory, new_filename)
-                    os.rename(file_path, new_file_path)
-                    logging.info(f"Renamed {filename} to {new_filename}")
+        for analysis in self.iter_analyses(directory, workers, chunk_size, cache_file):
+            results.append(analysis)
+            
+            # Count relevant and irrelevant pages
+            if analysis['is_relevant']:
+                relevant_count += 1
+            else:
+                irrelevant_count += 1
         
         # Log the counts
         logging.info(f"Total relevant files: {relevant_count}")
         logging.info(f"Total irrelevant files: {irrelevant_count}")
         
-        # Combine new results with existing ones
-        return existing_results + results, relevant_count, irrelevant_count
+        return results, relevant_count, irrelevant_count
 
-    def generate_summary(self, results: List[Dict]) -> Dict:
-        """Generate a summary of the analysis results."""
-        summary = {
-            'total_files': len(results),
-            'total_sentences': sum(r['num_sentences'] for r in results),
-            'total_words': sum(r['num_words'] for r in results),
-            'theme_statistics': {},
-            'common_entities': Counter(),
-            'common_terms': Counter()
-        }
+    def analyze_directory_streaming(self, directory: str, results_file: str, workers: int = 1,
+                                    chunk_size: int = 16, cache_file: str = "analysis_cache.sqlite") -> Dict:
+        """Analyze all pages, writing each result to a JSONL file as soon as it is produced.
         
-        # Aggregate theme matches
-        for category, subthemes in self.themes.items():
-            summary['theme_statistics'][category] = {}
-            for subtheme, details in subthemes.items():
-                theme_matches = []
-                for result in results:
-                    # Check if the theme matches exist in the result
-                    if category in result['theme_matches'] and subtheme in result['theme_matches'][category]:
-                        theme_matches.extend(result['theme_matches'][category][subtheme])
-                summary['theme_statistics'][category][subtheme] = {
-                    'num_matches': len(theme_matches),
-                    'description': details['description'],
-                    'examples': [m['sentence'] for m in theme_matches[:5]]  # Top 5 examples
-                }
+        The summary is aggregated along the way, so no results are kept in memory.
         
-        # Aggregate entities and terms
-        for result in results:
-            # Convert entity tuples to strings before updating Counter
-            entity_strings = [f"{entity[0]}_{entity[1]}" for entity in result['entities']]
-            summary['common_entities'].update(entity_strings)
-            summary['common_terms'].update(result['term_frequency'])
+        Returns:
+            The summary, including the relevant and irrelevant counts.
+            See iter_analyses for the other arguments.
+        """
+        aggregator = SummaryAggregator(self.themes)
+        with JsonlWriter(results_file) as writer:
+            for analysis in self.iter_analyses(directory, workers, chunk_size, cache_file):
+                writer.write(analysis)
+                aggregator.add(analysis)
+        
+        # Log the counts
+        logging.info(f"Total relevant files: {aggregator.relevant_count}")
+        logging.info(f"Total irrelevant files: {aggregator.irrelevant_count}")
         
+        summary = aggregator.summary()
+        summary['relevant_count'] = aggregator.relevant_count
+        summary['irrelevant_count'] = aggregator.irrelevant_count
         return summary
 
+    def generate_summary(self, results: Iterable[Dict]) -> Dict:
+        """Generate a summary of the analysis results."""
+        aggregator = SummaryAggregator(self.themes)
+        for result in results:
+            aggregator.add(result)
+        return aggregator.summary()
+
     def save_results(self, results: List[Dict], summary: Dict, relevant_count: int, irrelevant_count: int):
         """Save analysis results to JSON files."""
         timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -315,20 +478,63 @@ class ContentAnalyzer:
             json.dump(results, f, indent=2, ensure_ascii=False)
         
         # Save summary
-        summary_file = f'content_analysis_summary_{timestamp}.json'
         summary['relevant_count'] = relevant_count
         summary['irrelevant_count'] = irrelevant_count
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, ensure_ascii=False)
+        summary_file = self.save_summary(summary, timestamp)
         
         logging.info(f"Saved results to {results_file} and {summary_file}")
 
+    def save_summary(self, summary: Dict, timestamp: str) -> str:
+        """Save the analysis summary to a JSON file and return its name."""
+        summary_file = f'content_analysis_summary_{timestamp}.json'
+        with open(summary_file, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2, ensure_ascii=False)
+        return summary_file
+
+_worker_analyzer: Optional[ContentAnalyzer] = None
+_worker_store: Optional[PageStore] = None
+
+
+def _init_worker(analyzer: ContentAnalyzer, directory: str):
+    """Pool initializer: keep the analyzer and open the page store once per worker process."""
+    global _worker_analyzer, _worker_store
+    _worker_analyzer = analyzer
+    _worker_store = PageStore(directory)
+    # Load the models the profile needs now rather than inside the first chunk
+    if 'entities' in analyzer.fields:
+        ne_chunk(pos_tag(word_tokenize("Warm up")))
+    elif 'key_phrases' in analyzer.fields:
+        pos_tag(word_tokenize("Warm up"))
+
+
+def _analyze_chunk(jobs: List[Tuple[Dict, Tuple[str, ...]]]) -> List[Optional[Dict]]:
+    return [_worker_analyzer.analyze_page(_worker_store, page, fields) for page, fields in jobs]
+
+
 def main():
-    analyzer = ContentAnalyzer()
+    parser = argparse.ArgumentParser(description="Analyze saved webpage content for partnership themes")
+    parser.add_argument('--profile', choices=list(ANALYSIS_PROFILES), default='full',
+                        help="fast: themes and company mentions only; standard: adds key phrases and "
+                             "term frequencies; full: adds named entities (slowest)")
+    parser.add_argument('--stream', action='store_true',
+                        help="write results as JSONL while analyzing and aggregate the summary on the fly")
+    args = parser.parse_args()
+    
+    analyzer = ContentAnalyzer(profile=args.profile)
+    
+    if args.stream:
+        logging.info("Starting streaming content analysis...")
+        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        results_file = f'content_analysis_results_{timestamp}.jsonl'
+        summary = analyzer.analyze_directory_streaming('page_store', results_file, workers=os.cpu_count() or 1)
+        summary_file = analyzer.save_summary(summary, timestamp)
+        logging.info(f"Saved results to {results_file} and {summary_file}")
+        logging.info("Content analysis completed!")
+        return
     
     # Analyze webpage content
     logging.info("Starting content analysis...")
-    results, relevant_count, irrelevant_count = analyzer.analyze_directory('webpage_content')
+    results, relevant_count, irrelevant_count = analyzer.analyze_directory('page_store', workers=os.cpu_count() or 1)
     
     # Generate summary
     logging.info("Generating summary...")
@@ -0,0 +1,98 @@
+import queue
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict
+from selenium import webdriver
+
+
+class DriverPool:
+    """Bounded pool of reusable WebDriver instances.
+
+    Drivers are created lazily up to ``max_size``, health-checked when they
+    are leased and recycled after ``max_pages`` page loads or as soon as they
+    crash, so the Chrome start-up cost is paid once per worker instead of
+    once per page.
+    """
+
+    def __init__(self, factory: Callable[[], webdriver.Chrome], max_size: int = 2, max_pages: int = 50):
+        self.factory = factory
+        self.max_size = max_size
+        self.max_pages = max_pages
+        self.idle = queue.LifoQueue()
+        self.page_counts: Dict[int, int] = {}
+        self.created = 0
+        self.lock = threading.Lock()
+
+    def _is_healthy(self, driver: webdriver.Chrome) -> bool:
+        try:
+            driver.execute_script("return 1")
+            return True
+        except Exception:
+            return False
+
+    def _discard(self, driver: webdriver.Chrome):
+        self.page_counts.pop(id(driver), None)
+        with self.lock:
+            self.created -= 1
+        try:
+            driver.quit()
+        except Exception:
+            pass
+
+    def _acquire(self) -> webdriver.Chrome:
+        while True:
+            try:
+                driver = self.idle.get_nowait()
+            except queue.Empty:
+                with self.lock:
+                    can_create = self.created < self.max_size
+                    if can_create:
+                        self.created += 1
+                if can_create:
+                    try:
+                        driver = self.factory()
+                    except Exception:
+                        with self.lock:
+                            self.created -= 1
+                        raise
+                    self.page_counts[id(driver)] = 0
+                    return driver
+                try:
+                    driver = self.idle.get(timeout=1)
+                except queue.Empty:
+                    continue
+            if self._is_healthy(driver):
+                return driver
+            logging.info("Discarding unhealthy WebDriver")
+            self._discard(driver)
+
+    def _release(self, driver: webdriver.Chrome, failed: bool = False):
+        self.page_counts[id(driver)] = self.page_counts.get(id(driver), 0) + 1
+        if failed or self.page_counts[id(driver)] >= self.max_pages:
+            logging.info("Recycling WebDriver")
+            self._discard(driver)
+        else:
+            self.idle.put(driver)
+
+    @contextmanager
+    def lease(self):
+        """Lease a driver for one page load; it is returned to the pool afterwards."""
+        driver = self._acquire()
+        failed = False
+        try:
+            yield driver
+        except Exception:
+            failed = not self._is_healthy(driver)
+            raise
+        finally:
+            self._release(driver, failed)
+
+    def close(self):
+        """Quit all idle drivers."""
+        while True:
+            try:
+                driver = self.idle.get_nowait()
+            except queue.Empty:
+                break
+            self._discard(driver)
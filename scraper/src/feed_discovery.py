@@ -0,0 +1,121 @@
+import logging
+import xml.etree.ElementTree as ET
+from datetime import datetime
+from typing import List, Dict, Optional
+from urllib.parse import urljoin, urlparse
+import feedparser
+from bs4 import BeautifulSoup
+from fetcher import AsyncFetcher
+from metadata import parse_iso_date
+
+FEED_TYPES = ('application/rss+xml', 'application/atom+xml')
+SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+NEWS_NS = '{http://www.google.com/schemas/sitemap-news/0.9}'
+
+
+class FeedDiscovery:
+    """Find candidate article URLs and dates from RSS/Atom feeds and sitemaps.
+
+    Feeds advertised by a listing page are preferred; otherwise the site's
+    sitemaps (from robots.txt or /sitemap.xml) are read and restricted to the
+    listing page's path. Entries dated before ``min_date`` are dropped
+    before any article is fetched.
+    """
+
+    def __init__(self, fetcher: AsyncFetcher, min_date: datetime, max_entries: int = 500,
+                 max_sitemaps: int = 20):
+        self.fetcher = fetcher
+        self.min_date = min_date
+        self.max_entries = max_entries
+        self.max_sitemaps = max_sitemaps
+
+    def discover(self, listing_url: str, listing_html: Optional[str]) -> Optional[List[Dict]]:
+        """Return [{'url', 'date'}] entries for a listing page, or None if it has no feed or sitemap."""
+        entries = None
+        feed_urls = self.find_feed_links(listing_url, listing_html) if listing_html else []
+        if feed_urls:
+            entries = self.read_feeds(feed_urls)
+        if not entries:
+            entries = self.read_sitemaps(listing_url)
+        if not entries:
+            return None
+        entries = [e for e in entries if e['date'] is None or e['date'] >= self.min_date]
+        # Newest first, undated entries last
+        entries.sort(key=lambda e: e['date'] or datetime.min, reverse=True)
+        logging.info(f"Discovered {len(entries)} candidate articles for {listing_url} from feeds")
+        return entries[:self.max_entries]
+
+    def find_feed_links(self, listing_url: str, html: str) -> List[str]:
+        soup = BeautifulSoup(html, 'html.parser')
+        return [
+            urljoin(listing_url, link['href'])
+            for link in soup.find_all('link', href=True)
+            if link.get('type') in FEED_TYPES
+        ]
+
+    def read_feeds(self, feed_urls: List[str]) -> List[Dict]:
+        entries = []
+        for result in self.fetcher.fetch_all(feed_urls).values():
+            if result['html'] is None:
+                continue
+            feed = feedparser.parse(result['html'])
+            for entry in feed.entries:
+                if not entry.get('link'):
+                    continue
+                parsed = entry.get('published_parsed') or entry.get('updated_parsed')
+                entries.append({'url': entry.link, 'date': datetime(*parsed[:6]) if parsed else None})
+        return entries
+
+    def find_sitemaps(self, listing_url: str) -> List[str]:
+        parsed = urlparse(listing_url)
+        root = f"{parsed.scheme}://{parsed.netloc}"
+        if self.fetcher.scheduler:
+            # robots.txt is already cached by the scheduler
+            return self.fetcher.scheduler.site_maps(listing_url) or [f"{root}/sitemap.xml"]
+        robots = self.fetcher.fetch_all([f"{root}/robots.txt"])[f"{root}/robots.txt"]
+        sitemaps = []
+        if robots['html']:
+            for line in robots['html'].splitlines():
+                if line.lower().startswith('sitemap:'):
+                    sitemaps.append(line.split(':', 1)[1].strip())
+        return sitemaps or [f"{root}/sitemap.xml"]
+
+    def read_sitemaps(self, listing_url: str) -> List[Dict]:
+        """Read urlset entries under the listing page's path, following sitemap indexes.
+
+        For listings that are a page rather than a directory, e.g.
+        /about-us/newsroom.html, entries under the page's directory are read.
+        """
+        path = urlparse(listing_url).path
+        last_segment = path.rsplit('/', 1)[-1]
+        prefix = path[:len(path) - len(last_segment)] if '.' in last_segment else path.rstrip('/')
+        pending = self.find_sitemaps(listing_url)
+        visited = set()
+        entries = []
+        while pending and len(visited) < self.max_sitemaps:
+            limit = self.max_sitemaps - len(visited)
+            batch = [url for url in dict.fromkeys(pending[:limit]) if url and url not in visited]
+            pending = pending[limit:]
+            visited.update(batch)
+            for result in self.fetcher.fetch_all(batch).values():
+                if result['html'] is None:
+                    continue
+                try:
+                    root = ET.fromstring(result['html'].encode('utf-8'))
+                except ET.ParseError:
+                    logging.info(f"Could not parse sitemap {result['url']}")
+                    continue
+                if root.tag == f'{SITEMAP_NS}sitemapindex':
+                    for sitemap in root.iter(f'{SITEMAP_NS}sitemap'):
+                        lastmod = parse_iso_date(sitemap.findtext(f'{SITEMAP_NS}lastmod'))
+                        if lastmod is None or lastmod >= self.min_date:
+                            pending.append(sitemap.findtext(f'{SITEMAP_NS}loc', '').strip())
+                    continue
+                for url in root.iter(f'{SITEMAP_NS}url'):
+                    loc = url.findtext(f'{SITEMAP_NS}loc', '').strip()
+                    if not loc or not urlparse(loc).path.startswith(prefix):
+                        continue
+                    date = parse_iso_date(url.findtext(f'{NEWS_NS}news/{NEWS_NS}publication_date')) \
+                        or parse_iso_date(url.findtext(f'{SITEMAP_NS}lastmod'))
+                    entries.append({'url': loc, 'date': date})
+        return entries
@@ -0,0 +1,193 @@
+import time
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Optional
+from urllib.parse import urlparse
+import requests
+from requests.adapters import HTTPAdapter
+from http_cache import HttpCache
+from scheduler import CrawlScheduler, THROTTLE_STATUSES, ROBOTS_DISALLOWED
+
+DEFAULT_HEADERS = {'User-Agent': 'Mozilla/5.0'}
+
+
+class AsyncFetcher:
+    """Concurrent page fetcher with global and per-domain concurrency caps.
+
+    Requests are issued through one pooled, keep-alive ``requests.Session``;
+    asyncio drives the blocking calls on worker threads so many hosts can be
+    fetched at once while no single host receives more than
+    ``per_host_limit`` parallel requests. With an ``HttpCache`` attached,
+    pages seen before are revalidated with conditional requests. With a
+    ``CrawlScheduler`` attached, requests also obey per-host rate limits
+    and robots.txt, and throttled requests are retried after backing off.
+    """
+
+    def __init__(self, max_concurrency: int = 16, per_host_limit: int = 4, timeout: float = 10,
+                 headers: Optional[Dict] = None, cache: Optional[HttpCache] = None,
+                 scheduler: Optional[CrawlScheduler] = None, max_retries: int = 2):
+        self.max_concurrency = max_concurrency
+        self.per_host_limit = per_host_limit
+        self.timeout = timeout
+        self.cache = cache
+        self.scheduler = scheduler
+        self.max_retries = max_retries
+        self.session = requests.Session()
+        self.session.headers.update(headers or DEFAULT_HEADERS)
+        adapter = HTTPAdapter(pool_connections=max_concurrency, pool_maxsize=max_concurrency)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def _get(self, url: str) -> Dict:
+        """Blocking GET of a single URL, always returning a result dict."""
+        start = time.monotonic()
+        cached = self.cache.lookup(url) if self.cache else None
+        try:
+            response = self.session.get(url, timeout=self.timeout,
+                                        headers=self.cache.conditional_headers(cached) if cached else None)
+            if response.status_code == 304 and cached:
+                try:
+                    html = self.cache.load(url, cached)
+                except OSError:
+                    # Evicted since the lookup, possibly by another worker process
+                    response = self.session.get(url, timeout=self.timeout)
+                else:
+                    return {
+                        'url': url,
+                        'status': response.status_code,
+                        'html': html,
+                        'headers': dict(response.headers),
+                        'elapsed': time.monotonic() - start,
+                        'bytes': 0,
+                        'from_cache': True,
+                        'error': None
+                    }
+            response.raise_for_status()
+            if self.cache:
+                self.cache.store(url, response.text, response.headers)
+            return {
+                'url': url,
+                'status': response.status_code,
+                'html': response.text,
+                'headers': dict(response.headers),
+                'elapsed': time.monotonic() - start,
+                'bytes': len(response.content),
+                'from_cache': False,
+                'error': None
+            }
+        except requests.RequestException as e:
+            response = getattr(e, 'response', None)
+            return {
+                'url': url,
+                'status': response.status_code if response is not None else None,
+                'html': None,
+                'headers': dict(response.headers) if response is not None else {},
+                'elapsed': time.monotonic() - start,
+                'bytes': 0,
+                'from_cache': False,
+                'error': str(e)
+            }
+
+    def _get_head(self, url: str, max_bytes: int = 65536) -> Dict:
+        """Blocking partial GET that stops reading once the document <head> is complete."""
+        start = time.monotonic()
+        received = b''
+        try:
+            with self.session.get(url, timeout=self.timeout, stream=True) as response:
+                response.raise_for_status()
+                for chunk in response.iter_content(chunk_size=8192):
+                    received += chunk
+                    if b'</head>' in received.lower() or len(received) >= max_bytes:
+                        break
+                try:
+                    html = received.decode(response.encoding or 'utf-8', errors='replace')
+                except LookupError:
+                    # Unknown charset in the Content-Type header
+                    html = received.decode('utf-8', errors='replace')
+                return {
+                    'url': url,
+                    'status': response.status_code,
+                    'html': html,
+                    'headers': dict(response.headers),
+                    'elapsed': time.monotonic() - start,
+                    'bytes': len(received),
+                    'from_cache': False,
+                    'error': None
+                }
+        except requests.RequestException as e:
+            return {
+                'url': url,
+                'status': None,
+                'html': None,
+                'headers': {},
+                'elapsed': time.monotonic() - start,
+                'bytes': len(received),
+                'from_cache': False,
+                'error': str(e)
+            }
+
+    async def fetch(self, url: str, global_limit: asyncio.Semaphore, host_limits: Dict[str, asyncio.Semaphore],
+                    worker: Optional[Callable[[str], Dict]] = None) -> Dict:
+        host = urlparse(url).netloc
+        if host not in host_limits:
+            host_limits[host] = asyncio.Semaphore(self.per_host_limit)
+        loop = asyncio.get_running_loop()
+        async with host_limits[host]:
+            if self.scheduler and not await loop.run_in_executor(self.executor, self.scheduler.allowed, url):
+                logging.info(f"Skipping {url}, disallowed by robots.txt")
+                return {'url': url, 'status': None, 'html': None, 'headers': {}, 'elapsed': 0.0,
+                        'bytes': 0, 'from_cache': False, 'error': ROBOTS_DISALLOWED}
+            for attempt in range(self.max_retries + 1):
+                if self.scheduler:
+                    # Wait for the host's token bucket without holding a global slot
+                    delay = await loop.run_in_executor(self.executor, self.scheduler.reserve, url)
+                    if delay > 0:
+                        await asyncio.sleep(delay)
+                async with global_limit:
+                    result = await loop.run_in_executor(self.executor, worker or self._get, url)
+                if not self.scheduler:
+                    break
+                self.scheduler.record(url, result['status'], result['headers'])
+                if result['status'] not in THROTTLE_STATUSES:
+                    break
+        if result['error']:
+            logging.info(f"Fetch failed for {url}: {result['error']}")
+        return result
+
+    async def fetch_many(self, urls: List[str], worker: Optional[Callable[[str], Dict]] = None) -> List[Dict]:
+        """Fetch all URLs concurrently, returning results in input order.
+
+        An unexpected error fetching one URL becomes that URL's failed
+        result instead of failing the whole batch.
+        """
+        global_limit = asyncio.Semaphore(self.max_concurrency)
+        host_limits = {}
+        results = await asyncio.gather(*(self.fetch(url, global_limit, host_limits, worker) for url in urls),
+                                       return_exceptions=True)
+        for i, (url, result) in enumerate(zip(urls, results)):
+            if isinstance(result, Exception):
+                logging.error(f"Unexpected error fetching {url}: {str(result)}")
+                results[i] = {'url': url, 'status': None, 'html': None, 'headers': {}, 'elapsed': 0.0,
+                              'bytes': 0, 'from_cache': False, 'error': str(result)}
+        return results
+
+    def fetch_all(self, urls: List[str]) -> Dict[str, Dict]:
+        """Synchronous entry point: fetch URLs concurrently, keyed by URL."""
+        return self._run(urls, self._get)
+
+    def fetch_heads(self, urls: List[str]) -> Dict[str, Dict]:
+        """Concurrently fetch only the <head> section of each URL, keyed by URL."""
+        return self._run(urls, self._get_head)
+
+    def _run(self, urls: List[str], worker: Callable[[str], Dict]) -> Dict[str, Dict]:
+        unique_urls = CrawlScheduler.interleave(list(dict.fromkeys(urls)))
+        if not unique_urls:
+            return {}
+        results = asyncio.run(self.fetch_many(unique_urls, worker))
+        return {result['url']: result for result in results}
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+        self.session.close()
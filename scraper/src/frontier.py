@@ -0,0 +1,112 @@
+import time
+import sqlite3
+from typing import Dict, List, Optional
+from url_index import canonicalize_url
+
+LISTING_DEPTH = 0
+ARTICLE_DEPTH = 1
+
+
+class CrawlFrontier:
+    """Persistent crawl queue of (company, url, depth, state, attempts) rows in SQLite.
+
+    Items move from ``pending`` to ``in_progress`` when claimed and to
+    ``done`` or ``failed`` once handled. Every transition is committed
+    immediately, so after a crash ``resume`` puts the interrupted items
+    back to pending and the crawl continues exactly where it stopped.
+    """
+
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.path = path
+        self.max_attempts = max_attempts
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS frontier (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                company TEXT NOT NULL,
+                url TEXT NOT NULL,
+                canonical_url TEXT NOT NULL,
+                depth INTEGER NOT NULL,
+                parent TEXT,
+                state TEXT NOT NULL DEFAULT 'pending',
+                attempts INTEGER NOT NULL DEFAULT 0,
+                updated REAL NOT NULL,
+                UNIQUE (company, canonical_url)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS frontier_queue ON frontier (company, depth, state, id)")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS crawl (key TEXT PRIMARY KEY, value REAL NOT NULL)")
+        self.conn.commit()
+
+    def add(self, company: str, urls: List[str], depth: int, parent: Optional[str] = None):
+        """Enqueue URLs for a company; URLs already known to the frontier are ignored."""
+        now = time.time()
+        with self.conn:
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO frontier (company, url, canonical_url, depth, parent, updated) VALUES (?, ?, ?, ?, ?, ?)",
+                [(company, url, canonicalize_url(url), depth, parent, now) for url in urls]
+            )
+
+    def claim(self, company: str, depth: int, limit: Optional[int] = None) -> List[Dict]:
+        """Move the oldest pending items of a company and depth to in_progress and return them."""
+        with self.conn:
+            rows = self.conn.execute(
+                "SELECT * FROM frontier WHERE company = ? AND depth = ? AND state = 'pending' ORDER BY id LIMIT ?",
+                (company, depth, limit if limit is not None else -1)
+            ).fetchall()
+            self.conn.executemany(
+                "UPDATE frontier SET state = 'in_progress', attempts = attempts + 1, updated = ? WHERE id = ?",
+                [(time.time(), row['id']) for row in rows]
+            )
+        return [dict(row) for row in rows]
+
+    def mark_done(self, item: Dict):
+        with self.conn:
+            self.conn.execute("UPDATE frontier SET state = 'done', updated = ? WHERE id = ?", (time.time(), item['id']))
+
+    def mark_failed(self, item: Dict):
+        """Return a failed item to the queue, or give up on it after max_attempts."""
+        state = 'failed' if item['attempts'] + 1 >= self.max_attempts else 'pending'
+        with self.conn:
+            self.conn.execute("UPDATE frontier SET state = ?, updated = ? WHERE id = ?", (state, time.time(), item['id']))
+
+    def company_state(self, company: str) -> str:
+        """'new' if the company was never queued, 'unfinished' or 'done'."""
+        row = self.conn.execute(
+            "SELECT COUNT(*), SUM(state IN ('pending', 'in_progress')) FROM frontier WHERE company = ?", (company,)
+        ).fetchone()
+        if not row[0]:
+            return 'new'
+        return 'unfinished' if row[1] else 'done'
+
+    def has_unfinished(self) -> bool:
+        """True if the last crawl stopped before completing and left items to process."""
+        if self.is_complete():
+            return False
+        return self.conn.execute(
+            "SELECT 1 FROM frontier WHERE state IN ('pending', 'in_progress') LIMIT 1"
+        ).fetchone() is not None
+
+    def mark_complete(self):
+        """Record that the crawl ran to the end, even if some items failed."""
+        with self.conn:
+            self.conn.execute("INSERT OR REPLACE INTO crawl (key, value) VALUES ('completed', ?)", (time.time(),))
+
+    def is_complete(self) -> bool:
+        return self.conn.execute("SELECT 1 FROM crawl WHERE key = 'completed'").fetchone() is not None
+
+    def resume(self) -> int:
+        """Requeue items that were in progress when the last run stopped."""
+        with self.conn:
+            cursor = self.conn.execute("UPDATE frontier SET state = 'pending' WHERE state = 'in_progress'")
+        return cursor.rowcount
+
+    def clear(self):
+        with self.conn:
+            self.conn.execute("DELETE FROM frontier")
+            self.conn.execute("DELETE FROM crawl")
+
+    def close(self):
+        self.conn.close()
@@ -0,0 +1,153 @@
+from typing import Dict, List, Optional
+from bs4 import BeautifulSoup
+from metadata import extract_metadata
+
+try:
+    import lxml.html
+    DEFAULT_PARSER = 'lxml'
+except ImportError:
+    DEFAULT_PARSER = 'html.parser'
+
+# Selectors in priority order; each is either a tag name or a single .class
+TITLE_SELECTORS = ['h1', 'h2', '.article-title', '.post-title']
+BODY_SELECTORS = ['article', '.article-content', '.post-content', '.entry-content']
+DATE_SELECTORS = ['time', '.date', '.article-date', '.post-date']
+NON_TEXT_TAGS = ('script', 'style')
+
+
+def clean_whitespace(text: str) -> str:
+    """Collapse page text into one phrase per line, dropping empty lines."""
+    lines = (line.strip() for line in text.splitlines())
+    chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+    return '\n'.join(chunk for chunk in chunks if chunk)
+
+
+def parse_html(html: str, parser: Optional[str] = None) -> Dict:
+    """Parse a page once and extract everything the scraper needs from it.
+
+    Args:
+        html: Raw HTML of the page
+        parser: 'lxml' (fast, default when installed) or 'html.parser'
+
+    Returns:
+        Dict with the title, article body text, date candidates (in selector
+        priority order), structured metadata (JSON-LD, OpenGraph and <meta>
+        title and publication date) and clean plain text of the whole page
+    """
+    parser = parser or DEFAULT_PARSER
+    if parser == 'lxml':
+        return _parse_with_lxml(html)
+    return _parse_with_soup(html, parser)
+
+
+def _first_matches(elements, selectors: List[str]) -> Dict[str, object]:
+    """Find the first element for each selector and collect paragraphs and metadata in a single walk."""
+    wanted_tags = {s for s in selectors if not s.startswith('.')}
+    wanted_classes = {s[1:] for s in selectors if s.startswith('.')}
+    first = {}
+    paragraphs = []
+    metas = []
+    json_ld = []
+    time_datetime = None
+    for element in elements:
+        tag = element.tag
+        if not isinstance(tag, str):
+            continue  # comments and processing instructions
+        if tag == 'p':
+            paragraphs.append(element)
+        elif tag == 'meta':
+            metas.append(dict(element.attrib))
+        elif tag == 'script' and element.get('type') == 'application/ld+json':
+            json_ld.append(element.text or '')
+        elif tag == 'time' and time_datetime is None and element.get('datetime'):
+            time_datetime = element.get('datetime')
+        if tag in wanted_tags and tag not in first:
+            first[tag] = element
+        for cls in element.get('class', '').split():
+            if cls in wanted_classes and f'.{cls}' not in first:
+                first[f'.{cls}'] = element
+    first['p'] = paragraphs
+    first['metadata'] = extract_metadata(metas, json_ld, time_datetime)
+    return first
+
+
+def _stripped_text(element) -> str:
+    # Same as BeautifulSoup's get_text(strip=True)
+    return ''.join(s.strip() for s in element.itertext())
+
+
+def _parse_with_lxml(html: str) -> Dict:
+    if not html.strip():
+        return {'title': None, 'text': "", 'date_candidates': [], 'clean_text': "",
+                'metadata': {'title': None, 'published': None}}
+    try:
+        root = lxml.html.document_fromstring(html)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        root = lxml.html.document_fromstring(html.encode('utf-8'))
+    first = _first_matches(root.iter(), TITLE_SELECTORS + BODY_SELECTORS + DATE_SELECTORS)
+
+    # JSON-LD is already collected; drop scripts and styles before taking any text
+    for element in list(root.iter(*NON_TEXT_TAGS)):
+        element.drop_tree()
+
+    title = next((_stripped_text(first[s]) for s in TITLE_SELECTORS if s in first), None)
+    text = next((_stripped_text(first[s]) for s in BODY_SELECTORS if s in first), "")
+    if not text:
+        text = ' '.join(_stripped_text(p) for p in first['p'])
+    date_candidates = [_stripped_text(first[s]) for s in DATE_SELECTORS if s in first]
+
+    clean_text = clean_whitespace(''.join(root.itertext()))
+
+    return {
+        'title': title or None,
+        'text': text,
+        'date_candidates': [d for d in date_candidates if d],
+        'metadata': first['metadata'],
+        'clean_text': clean_text
+    }
+
+
+def _parse_with_soup(html: str, parser: str) -> Dict:
+    soup = BeautifulSoup(html, parser)
+
+    title = None
+    for selector in TITLE_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            title = element.get_text(strip=True)
+            break
+
+    text = ""
+    for selector in BODY_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            text = element.get_text(strip=True)
+            break
+    if not text:
+        text = ' '.join(p.get_text(strip=True) for p in soup.find_all('p'))
+
+    date_candidates = []
+    for selector in DATE_SELECTORS:
+        element = soup.select_one(selector)
+        if element:
+            date_candidates.append(element.get_text(strip=True))
+
+    time_element = soup.find('time', datetime=True)
+    metadata = extract_metadata(
+        [dict(meta.attrs) for meta in soup.find_all('meta')],
+        [script.string or '' for script in soup.find_all('script', type='application/ld+json')],
+        time_element['datetime'] if time_element else None
+    )
+
+    for element in soup(list(NON_TEXT_TAGS)):
+        element.decompose()
+    clean_text = clean_whitespace(soup.get_text())
+
+    return {
+        'title': title or None,
+        'text': text,
+        'date_candidates': [d for d in date_candidates if d],
+        'metadata': metadata,
+        'clean_text': clean_text
+    }
@@ -0,0 +1,126 @@
+import os
+import time
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Optional
+from url_index import canonicalize_url
+
+
+class HttpCache:
+    """Persistent, content-addressed HTTP response cache with LRU eviction.
+
+    Response bodies are stored once per SHA-256 hash under ``blobs/`` and an
+    SQLite index maps canonical URLs to their body hash and validators
+    (ETag, Last-Modified). Stored validators let re-crawls send conditional
+    requests, so unchanged pages come back as a bodiless 304. Once the
+    stored bodies exceed ``max_bytes``, the least recently used entries are
+    evicted.
+    """
+
+    def __init__(self, directory: str = "http_cache", max_bytes: int = 500 * 1024 * 1024):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(directory, "index.sqlite"), timeout=30, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS entries (
+                url TEXT PRIMARY KEY,
+                hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                last_access REAL NOT NULL
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access)")
+        self.conn.execute("CREATE INDEX IF NOT EXISTS entries_hash ON entries (hash)")
+        self.conn.commit()
+        self.total_bytes = self.conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT DISTINCT hash, size FROM entries)"
+        ).fetchone()[0]
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        """Return the cached validators for a URL, if any."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT hash, etag, last_modified FROM entries WHERE url = ?", (canonicalize_url(url),)
+            ).fetchone()
+        if row is None or not os.path.exists(self._blob_path(row[0])):
+            return None
+        return {'hash': row[0], 'etag': row[1], 'last_modified': row[2]}
+
+    def conditional_headers(self, entry: Optional[Dict]) -> Dict:
+        headers = {}
+        if entry:
+            if entry['etag']:
+                headers['If-None-Match'] = entry['etag']
+            if entry['last_modified']:
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def load(self, url: str, entry: Dict) -> str:
+        """Read a cached body after a 304 and mark it as recently used."""
+        with open(self._blob_path(entry['hash']), 'rb') as f:
+            body = f.read()
+        with self.lock:
+            self.conn.execute("UPDATE entries SET last_access = ? WHERE url = ?", (time.time(), canonicalize_url(url)))
+            self.conn.commit()
+        return body.decode('utf-8')
+
+    def store(self, url: str, body: str, headers: Dict):
+        """Store a response body if it carries validators for later revalidation."""
+        etag = headers.get('ETag')
+        last_modified = headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        data = body.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        key = canonicalize_url(url)
+        with self.lock:
+            if self.conn.execute("SELECT 1 FROM entries WHERE hash = ?", (digest,)).fetchone() is None:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_path, path)
+                self.total_bytes += len(data)
+            previous = self.conn.execute("SELECT hash, size FROM entries WHERE url = ?", (key,)).fetchone()
+            self.conn.execute(
+                "INSERT OR REPLACE INTO entries (url, hash, size, etag, last_modified, last_access) VALUES (?, ?, ?, ?, ?, ?)",
+                (key, digest, len(data), etag, last_modified, time.time())
+            )
+            if previous and previous[0] != digest:
+                self._drop_blob_if_unused(*previous)
+            self.conn.commit()
+            if self.total_bytes > self.max_bytes:
+                self._evict()
+
+    def _drop_blob_if_unused(self, digest: str, size: int):
+        if self.conn.execute("SELECT 1 FROM entries WHERE hash = ?", (digest,)).fetchone() is None:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+            self.total_bytes -= size
+
+    def _evict(self):
+        """Drop least recently used entries until the stored bodies fit in max_bytes."""
+        rows = self.conn.execute("SELECT url, hash, size FROM entries ORDER BY last_access")
+        for url, digest, size in rows.fetchall():
+            if self.total_bytes <= self.max_bytes:
+                break
+            self.conn.execute("DELETE FROM entries WHERE url = ?", (url,))
+            self._drop_blob_if_unused(digest, size)
+        self.conn.commit()
+        logging.info(f"Evicted HTTP cache entries, {self.total_bytes} bytes remain")
+
+    def close(self):
+        self.conn.close()
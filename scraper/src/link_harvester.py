@@ -0,0 +1,89 @@
+import re
+from typing import List, Dict, Optional
+from urllib.parse import urlparse
+from selenium import webdriver
+from url_index import canonicalize_url
+
+# Collect every link target on the page in a single WebDriver round trip
+HARVEST_SCRIPT = "return Array.from(document.querySelectorAll('a[href]'), a => a.href);"
+SAME_HOST_HARVEST_SCRIPT = (
+    "return Array.from(document.querySelectorAll('a[href]'), a => a.href)"
+    ".filter(h => { try { return new URL(h).host === location.host; } catch (e) { return false; } });"
+)
+
+# Paths that are navigation, account or legal pages rather than articles
+DEFAULT_EXCLUDED_PATHS = [
+    r'/(tag|tags|author|authors|search|login|signin|signup|register|account)(/|$)',
+    r'/(contact|contact-us|careers|jobs|privacy|legal|terms|cookies?|cookie-policy|sitemap)(/|$)',
+    r'/page/\d+/?$',
+    r'/(feed|rss)/?$'
+]
+ASSET_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.svg', '.webp', '.ico', '.css', '.js',
+    '.zip', '.mp4', '.mp3', '.woff', '.woff2', '.xml', '.json'
+)
+
+
+def harvest_links(driver: webdriver.Chrome, same_host_only: bool = False) -> List[str]:
+    """Return all absolute hrefs from the rendered page with one script execution."""
+    script = SAME_HOST_HARVEST_SCRIPT if same_host_only else HARVEST_SCRIPT
+    return [href for href in driver.execute_script(script) or [] if href]
+
+
+def site_domain(host: str) -> str:
+    """Approximate the registrable domain of a host (news.sap.com -> sap.com)."""
+    host = host.lower().split(':')[0]
+    return '.'.join(host.split('.')[-2:])
+
+
+class LinkFilter:
+    """Decide which harvested links are candidate articles for one listing page.
+
+    Args:
+        base_url: The listing page the links were harvested from
+        same_domain: Only keep links on the listing page's site
+        article_pattern: Optional regex a link's path must match
+        excluded_paths: Regexes for paths that are never articles
+    """
+
+    def __init__(self, base_url: str, same_domain: bool = True, article_pattern: Optional[str] = None,
+                 excluded_paths: Optional[List[str]] = None):
+        self.base_url = base_url
+        self.base_canonical = canonicalize_url(base_url)
+        self.domain = site_domain(urlparse(base_url).netloc)
+        self.same_domain = same_domain
+        self.article_pattern = re.compile(article_pattern) if article_pattern else None
+        self.excluded_paths = re.compile('|'.join(excluded_paths if excluded_paths is not None else DEFAULT_EXCLUDED_PATHS))
+
+    def accepts(self, url: str) -> bool:
+        try:
+            parsed = urlparse(url)
+            parsed.port
+        except ValueError:
+            return False  # malformed host or port, e.g. http://[foo or https://x.com:abc/
+        if parsed.scheme not in ('http', 'https') or not parsed.netloc:
+            return False
+        if self.same_domain and site_domain(parsed.netloc) != self.domain:
+            return False
+        path = parsed.path.lower()
+        if path in ('', '/') or path.endswith(ASSET_EXTENSIONS):
+            return False
+        if self.excluded_paths.pattern and self.excluded_paths.search(path):
+            return False
+        if self.article_pattern and not self.article_pattern.search(parsed.path):
+            return False
+        return True
+
+    def filter(self, urls: List[str]) -> List[str]:
+        """Keep accepted links, deduplicated by canonical URL in first-seen order."""
+        kept: Dict[str, str] = {}
+        for url in urls:
+            try:
+                canonical = canonicalize_url(url)
+            except ValueError:
+                continue  # malformed host or port
+            if canonical in kept or canonical == self.base_canonical:
+                continue
+            if self.accepts(url):
+                kept[canonical] = url
+        return list(kept.values())
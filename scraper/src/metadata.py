@@ -0,0 +1,81 @@
+import re
+import json
+from datetime import datetime
+from typing import Dict, List, Optional
+
+# <meta> names and properties that carry an article's publication date, in priority order
+DATE_META_KEYS = [
+    'article:published_time', 'og:published_time', 'datepublished', 'date', 'pubdate',
+    'publishdate', 'publish-date', 'publish_date', 'dc.date', 'dc.date.issued',
+    'dcterms.date', 'dcterms.created', 'sailthru.date', 'parsely-pub-date'
+]
+TITLE_META_KEYS = ['og:title', 'twitter:title']
+URL_DATE_PATTERN = re.compile(r'/(20\d{2})/(0?[1-9]|1[0-2])(?:/(0?[1-9]|[12]\d|3[01]))?/')
+
+
+def parse_iso_date(value: Optional[str]) -> Optional[datetime]:
+    """Parse an ISO 8601 date as used in metadata and sitemaps, dropping any timezone."""
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.strip().replace('Z', '+00:00')).replace(tzinfo=None)
+    except ValueError:
+        return None
+
+
+def _json_ld_objects(data) -> List[Dict]:
+    """Flatten JSON-LD documents, lists and @graph containers into plain objects."""
+    if isinstance(data, list):
+        return [obj for item in data for obj in _json_ld_objects(item)]
+    if isinstance(data, dict):
+        return [data] + _json_ld_objects(data.get('@graph', []))
+    return []
+
+
+def extract_metadata(metas: List[Dict[str, str]], json_ld: List[str], time_datetime: Optional[str]) -> Dict:
+    """Pick the title and publication date from structured page metadata.
+
+    Args:
+        metas: Attributes of every <meta> tag on the page
+        json_ld: Contents of every application/ld+json script
+        time_datetime: The datetime attribute of the first <time> element carrying one
+
+    Returns:
+        Dict with 'title' and 'published' (ISO string as found), either may be None
+    """
+    title = None
+    published = None
+
+    for raw in json_ld:
+        try:
+            objects = _json_ld_objects(json.loads(raw))
+        except (json.JSONDecodeError, TypeError):
+            continue
+        for obj in objects:
+            if not published and isinstance(obj.get('datePublished'), str):
+                published = obj['datePublished']
+            if not title and isinstance(obj.get('headline'), str):
+                title = obj['headline'].strip()
+
+    values = {}
+    for attrs in metas:
+        key = (attrs.get('property') or attrs.get('name') or attrs.get('itemprop') or '').lower()
+        if key and attrs.get('content') and key not in values:
+            values[key] = attrs['content'].strip()
+    if not published:
+        published = next((values[key] for key in DATE_META_KEYS if key in values), None)
+    if not published and time_datetime:
+        published = time_datetime.strip()
+    if not title:
+        title = next((values[key] for key in TITLE_META_KEYS if key in values), None)
+
+    return {'title': title or None, 'published': published or None}
+
+
+def date_from_url(url: str) -> Optional[datetime]:
+    """Read a publication date from URL paths like /2024/03/15/slug or /2024/03/slug."""
+    match = URL_DATE_PATTERN.search(url)
+    if not match:
+        return None
+    year, month, day = match.groups()
+    return datetime(int(year), int(month), int(day or 1))
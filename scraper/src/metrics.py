@@ -0,0 +1,193 @@
+import json
+import time
+import bisect
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+# Latency histogram bucket bounds in seconds (Prometheus style, +Inf is implicit)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+COUNTERS = ('requests', 'errors', 'bytes_fetched', 'cache_hits', 'pages_static', 'pages_rendered')
+
+# (stage or counter name, company, domain)
+Key = Tuple[str, str, str]
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram that can estimate quantiles."""
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def merge(self, other: 'Histogram'):
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.sum += other.sum
+        self.count += other.count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the q-quantile (the largest finite bound for +Inf)."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return self.buckets[-1]
+
+    def summary(self) -> Dict:
+        return {
+            'count': self.count,
+            'total_seconds': round(self.sum, 6),
+            'mean_seconds': round(self.sum / self.count, 6) if self.count else None,
+            'p50_seconds': self.quantile(0.5),
+            'p90_seconds': self.quantile(0.9),
+            'p99_seconds': self.quantile(0.99)
+        }
+
+
+def _label(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+class CrawlMetrics:
+    """Per-stage latency histograms and fetch counters, labelled by company and domain.
+
+    Stages are timed with ``timer``; fetch results are recorded with
+    ``record_fetch``. The current company is set by the crawl loop, the
+    domain is taken from the URL each measurement is about. Totals are
+    exported as a JSON run report and as a Prometheus text snapshot.
+    """
+
+    def __init__(self):
+        self.company = ''
+        self.started = time.time()
+        self.lock = threading.Lock()
+        self.histograms: Dict[Key, Histogram] = {}
+        self.counters: Dict[Key, float] = {}
+
+    def _key(self, name: str, url: Optional[str]) -> Key:
+        return (name, self.company or '', urlparse(url).netloc if url else '')
+
+    def observe(self, stage: str, seconds: float, url: Optional[str] = None):
+        key = self._key(stage, url)
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = Histogram()
+            histogram.observe(seconds)
+
+    def count(self, counter: str, url: Optional[str] = None, value: float = 1):
+        key = self._key(counter, url)
+        with self.lock:
+            self.counters[key] = self.counters.get(key, 0) + value
+
+    @contextmanager
+    def timer(self, stage: str, url: Optional[str] = None):
+        """Time a block as one observation of the stage; exceptions are counted as errors."""
+        start = time.monotonic()
+        try:
+            yield
+        except Exception:
+            self.count('errors', url)
+            raise
+        finally:
+            self.observe(stage, time.monotonic() - start, url)
+
+    def record_fetch(self, result: Dict, stage: str = 'fetch'):
+        """Record an AsyncFetcher result: latency, bytes, cache hits and failures."""
+        url = result['url']
+        self.observe(stage, result['elapsed'], url)
+        self.count('requests', url)
+        self.count('bytes_fetched', url, result['bytes'])
+        if result['from_cache']:
+            self.count('cache_hits', url)
+        if result['html'] is None:
+            self.count('errors', url)
+
+    def snapshot(self) -> Dict:
+        """Picklable copy of the raw measurements, e.g. to send from a worker process."""
+        with self.lock:
+            return {'histograms': dict(self.histograms), 'counters': dict(self.counters)}
+
+    def merge(self, snapshot: Dict):
+        """Add measurements taken elsewhere, e.g. by crawl worker processes."""
+        with self.lock:
+            for key, histogram in snapshot['histograms'].items():
+                self.histograms.setdefault(key, Histogram(histogram.buckets)).merge(histogram)
+            for key, value in snapshot['counters'].items():
+                self.counters[key] = self.counters.get(key, 0) + value
+
+    def _breakdown(self, label_index: int) -> Dict[str, Dict]:
+        """Stage summaries and counters grouped by company (1) or domain (2)."""
+        groups: Dict[str, Dict] = {}
+        stage_histograms: Dict[str, Dict[str, Histogram]] = {}
+        for key, histogram in self.histograms.items():
+            stages = stage_histograms.setdefault(key[label_index], {})
+            stages.setdefault(key[0], Histogram(histogram.buckets)).merge(histogram)
+        for key, value in self.counters.items():
+            group = groups.setdefault(key[label_index], {name: 0 for name in COUNTERS})
+            group[key[0]] = group.get(key[0], 0) + value
+        for label, stages in stage_histograms.items():
+            groups.setdefault(label, {name: 0 for name in COUNTERS})['stages'] = {
+                stage: histogram.summary() for stage, histogram in sorted(stages.items())
+            }
+        for group in groups.values():
+            group['error_rate'] = round(group['errors'] / group['requests'], 4) if group['requests'] else None
+        return dict(sorted(groups.items()))
+
+    def report(self) -> Dict:
+        with self.lock:
+            stages: Dict[str, Histogram] = {}
+            for key, histogram in self.histograms.items():
+                stages.setdefault(key[0], Histogram(histogram.buckets)).merge(histogram)
+            totals = {name: 0 for name in COUNTERS}
+            for key, value in self.counters.items():
+                totals[key[0]] = totals.get(key[0], 0) + value
+            return {
+                'started': time.strftime('%Y-%m-%dT%H:%M:%S', time.localtime(self.started)),
+                'duration_seconds': round(time.time() - self.started, 3),
+                'totals': totals,
+                'error_rate': round(totals['errors'] / totals['requests'], 4) if totals['requests'] else None,
+                'stages': {stage: histogram.summary() for stage, histogram in sorted(stages.items())},
+                'companies': self._breakdown(1),
+                'domains': self._breakdown(2)
+            }
+
+    def prometheus_text(self) -> str:
+        """Snapshot in the Prometheus text exposition format."""
+        lines: List[str] = []
+        with self.lock:
+            lines.append('# HELP scraper_stage_seconds Latency of scraper pipeline stages.')
+            lines.append('# TYPE scraper_stage_seconds histogram')
+            for (stage, company, domain), histogram in sorted(self.histograms.items()):
+                labels = f'stage="{_label(stage)}",company="{_label(company)}",domain="{_label(domain)}"'
+                cumulative = 0
+                for bound, count in zip(histogram.buckets + ('+Inf',), histogram.counts):
+                    cumulative += count
+                    lines.append(f'scraper_stage_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'scraper_stage_seconds_sum{{{labels}}} {histogram.sum}')
+                lines.append(f'scraper_stage_seconds_count{{{labels}}} {histogram.count}')
+            for counter in COUNTERS:
+                lines.append(f'# TYPE scraper_{counter}_total counter')
+                for (name, company, domain), value in sorted(self.counters.items()):
+                    if name == counter:
+                        lines.append(f'scraper_{counter}_total{{company="{_label(company)}",'
+                                     f'domain="{_label(domain)}"}} {value}')
+        return '\n'.join(lines) + '\n'
+
+    def save(self, report_file: str = "crawl_report.json", prometheus_file: str = "crawl_metrics.prom"):
+        with open(report_file, 'w', encoding='utf-8') as f:
+            json.dump(self.report(), f, indent=2, ensure_ascii=False)
+        with open(prometheus_file, 'w', encoding='utf-8') as f:
+            f.write(self.prometheus_text())
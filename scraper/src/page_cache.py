@@ -0,0 +1,60 @@
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+from url_index import canonicalize_url
+
+
+class PageCache:
+    """In-memory cache of fetched pages for the duration of a run.
+
+    Entries are keyed by canonical URL and hold the raw HTML, whether it
+    came from a static fetch or a browser render, and fetch metadata. The
+    least recently used page is dropped once ``max_entries`` is exceeded.
+    Failed static fetches are kept separately, so a URL that failed is not
+    fetched again in the same run.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self.max_entries = max_entries
+        self.pages: OrderedDict = OrderedDict()
+        self.failures: OrderedDict = OrderedDict()
+
+    def get(self, url: str) -> Optional[Dict]:
+        key = canonicalize_url(url)
+        page = self.pages.get(key)
+        if page is not None:
+            self.pages.move_to_end(key)
+        return page
+
+    def put(self, url: str, html: str, source: str, status: Optional[int] = None,
+            headers: Optional[Dict] = None, elapsed: Optional[float] = None) -> Dict:
+        page = {
+            'url': url,
+            'html': html,
+            'source': source,
+            'status': status,
+            'headers': headers or {},
+            'elapsed': elapsed,
+            'fetched_at': time.time()
+        }
+        key = canonicalize_url(url)
+        self.pages[key] = page
+        self.pages.move_to_end(key)
+        self.failures.pop(key, None)
+        while len(self.pages) > self.max_entries:
+            self.pages.popitem(last=False)
+        return page
+
+    def failure(self, url: str) -> Optional[Dict]:
+        """The failed fetch result of a URL, if its static fetch failed in this run."""
+        return self.failures.get(canonicalize_url(url))
+
+    def put_failure(self, url: str, result: Dict):
+        key = canonicalize_url(url)
+        self.failures[key] = result
+        self.failures.move_to_end(key)
+        while len(self.failures) > self.max_entries:
+            self.failures.popitem(last=False)
+
+    def __contains__(self, url: str) -> bool:
+        return canonicalize_url(url) in self.pages
@@ -0,0 +1,178 @@
+import os
+import time
+import zlib
+import sqlite3
+import hashlib
+import logging
+import threading
+from typing import Dict, Iterable, Iterator, Optional
+from url_index import canonicalize_url
+
+# Suffixes the old content analyzer appended to the names of analyzed text files
+LABEL_SUFFIXES = ('_relevant', '_irrelevant')
+
+
+class PageStore:
+    """Compressed, content-addressed store for the plain text of saved pages.
+
+    Each distinct text is stored once, zlib-compressed, under ``blobs/`` by
+    its SHA-256 hash. An SQLite index maps (company, canonical URL) to the
+    text hash, its size and when it was fetched, so readers list pages
+    with a single query instead of scanning a directory.
+    """
+
+    def __init__(self, directory: str = "page_store", level: int = 6):
+        self.directory = directory
+        self.level = level
+        os.makedirs(os.path.join(directory, "blobs"), exist_ok=True)
+        self.lock = threading.Lock()
+        self.conn = sqlite3.connect(os.path.join(directory, "index.sqlite"), timeout=30, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS pages (
+                company TEXT NOT NULL,
+                canonical_url TEXT NOT NULL,
+                url TEXT NOT NULL,
+                hash TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                PRIMARY KEY (company, canonical_url)
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS pages_hash ON pages (hash)")
+        self.conn.commit()
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "blobs", digest[:2], digest)
+
+    def put(self, url: str, company: str, text: str, fetched_at: Optional[float] = None) -> str:
+        """Store a page's text and return its hash; identical texts share one blob."""
+        data = text.encode('utf-8')
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(zlib.compress(data, self.level))
+            os.replace(tmp_path, path)
+        with self.lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO pages (company, canonical_url, url, hash, size, fetched_at) VALUES (?, ?, ?, ?, ?, ?)",
+                (company, canonicalize_url(url), url, digest, len(data), fetched_at or time.time())
+            )
+            self.conn.commit()
+        return digest
+
+    def entry(self, url: str, company: str) -> Optional[Dict]:
+        """Index entry (url, company, hash, size, fetched_at) of a stored page."""
+        with self.lock:
+            row = self.conn.execute(
+                "SELECT url, company, hash, size, fetched_at FROM pages WHERE company = ? AND canonical_url = ?",
+                (company, canonicalize_url(url))
+            ).fetchone()
+        return dict(row) if row else None
+
+    def read(self, digest: str) -> str:
+        """Text stored under a hash."""
+        with open(self._blob_path(digest), 'rb') as f:
+            return zlib.decompress(f.read()).decode('utf-8')
+
+    def get(self, url: str, company: str) -> Optional[str]:
+        entry = self.entry(url, company)
+        return self.read(entry['hash']) if entry else None
+
+    def iter_pages(self, company: Optional[str] = None, batch_size: int = 1000) -> Iterator[Dict]:
+        """Yield the index entries of all stored pages, optionally for one company.
+
+        Entries do not carry the text; read it with ``read(entry['hash'])``.
+        The index is read in key order, ``batch_size`` rows at a time, so
+        memory does not grow with the number of stored pages.
+        """
+        conditions, params = [], []
+        if company is not None:
+            conditions.append("company = ?")
+            params.append(company)
+        last_key = None
+        while True:
+            where, args = list(conditions), list(params)
+            if last_key is not None:
+                where.append("(company, canonical_url) > (?, ?)")
+                args.extend(last_key)
+            query = "SELECT company, canonical_url, url, hash, size, fetched_at FROM pages"
+            if where:
+                query += " WHERE " + " AND ".join(where)
+            with self.lock:
+                rows = self.conn.execute(query + " ORDER BY company, canonical_url LIMIT ?",
+                                         args + [batch_size]).fetchall()
+            for row in rows:
+                yield {key: row[key] for key in ('url', 'company', 'hash', 'size', 'fetched_at')}
+            if len(rows) < batch_size:
+                return
+            last_key = (rows[-1]['company'], rows[-1]['canonical_url'])
+
+    def import_text_files(self, directory: str, urls_by_company: Dict[str, Iterable[str]]) -> int:
+        """Import pages saved as UTF-16LE ``{company}_{url}.txt`` files by earlier versions.
+
+        The file names replaced the slashes of the URL with underscores, and
+        the old analyzer appended ``_relevant`` or ``_irrelevant`` to them,
+        so each file is matched against the known URLs of its company with
+        those suffixes stripped. Files that match no known URL are skipped
+        rather than stored under a guessed URL. Pages already in the store
+        are skipped too, which makes repeated imports cheap no-ops.
+
+        Args:
+            directory: The old webpage_content directory
+            urls_by_company: Known article and listing URLs of each company
+
+        Returns:
+            The number of imported pages
+        """
+        if not os.path.isdir(directory):
+            return 0
+        # Longest names first, so "Google Cloud" is not taken for a company "Google"
+        companies = sorted(urls_by_company, key=len, reverse=True)
+        known = {
+            (company, url.replace('https://', '').replace('http://', '').replace('/', '_')): url
+            for company in companies for url in urls_by_company[company]
+        }
+        imported = 0
+        unmatched = 0
+        for name in sorted(os.listdir(directory)):
+            if not name.endswith('.txt'):
+                continue
+            stem = name[:-len('.txt')]
+            company = next((c for c in companies if stem.startswith(f"{c}_")), None)
+            if company is None:
+                unmatched += 1
+                continue
+            safe_url = stem[len(company) + 1:]
+            url = known.get((company, safe_url))
+            while url is None and safe_url.endswith(LABEL_SUFFIXES):
+                safe_url = safe_url.rsplit('_', 1)[0]
+                url = known.get((company, safe_url))
+            if url is None:
+                unmatched += 1
+                continue
+            if self.entry(url, company) is not None:
+                continue
+            path = os.path.join(directory, name)
+            try:
+                with open(path, 'r', encoding='utf-16le') as f:
+                    text = f.read().lstrip('\ufeff')
+            except (OSError, UnicodeDecodeError) as e:
+                logging.error(f"Could not import {path}: {str(e)}")
+                continue
+            self.put(url, company, text, fetched_at=os.path.getmtime(path))
+            imported += 1
+        if unmatched:
+            logging.info(f"Skipped {unmatched} files in {directory} that match no known URL")
+        return imported
+
+    def __len__(self) -> int:
+        with self.lock:
+            return self.conn.execute("SELECT COUNT(*) FROM pages").fetchone()[0]
+
+    def close(self):
+        self.conn.close()
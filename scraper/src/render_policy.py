@@ -0,0 +1,96 @@
+import os
+import json
+import zlib
+import logging
+from typing import Dict
+from urllib.parse import urlparse
+
+# Markers of pages that only render their content with JavaScript or sit behind a challenge
+JS_SHELL_MARKERS = [
+    'enable javascript', 'javascript is required', 'javascript is disabled',
+    'cf-browser-verification', 'challenge-platform', 'just a moment...',
+    'checking your browser'
+]
+# Statuses of bot walls that the browser may get past
+BOT_WALL_STATUSES = (401, 403)
+
+
+class RenderPolicy:
+    """Decide whether a page can be used as fetched or must be rendered in the browser.
+
+    A static page is escalated to the browser when it has no title, too
+    little text or a JavaScript-shell marker. Escalations are counted per
+    domain; once a domain needs the browser for most pages it is rendered
+    directly, skipping the wasted static attempt. One in ``probe_every``
+    URLs of such a domain is still fetched statically, so the decision is
+    reversed once the static pages are complete again. Decisions are kept
+    in ``state_file`` so later runs start from them.
+    """
+
+    def __init__(self, state_file: str = "render_domains.json", min_text_chars: int = 200,
+                 min_samples: int = 2, probe_every: int = 20):
+        self.state_file = state_file
+        self.min_text_chars = min_text_chars
+        self.min_samples = min_samples
+        self.probe_every = probe_every
+        self.domains: Dict[str, Dict[str, int]] = {}
+        if os.path.exists(state_file):
+            try:
+                with open(state_file, 'r') as f:
+                    self.domains = json.load(f)
+            except json.JSONDecodeError:
+                logging.warning(f"Could not load {state_file}, starting with empty render decisions")
+
+    def render_first(self, url: str) -> bool:
+        """Whether this URL should skip the static fetch because its domain needs the browser."""
+        return self._render_first_domain(url) and not self._is_probe(url)
+
+    def _render_first_domain(self, url: str) -> bool:
+        stats = self.domains.get(urlparse(url).netloc)
+        if not stats:
+            return False
+        return stats['escalated'] >= self.min_samples and stats['escalated'] > stats['static']
+
+    def _is_probe(self, url: str) -> bool:
+        # Stable per URL, so every stage of the crawl agrees on which URLs are probes
+        return zlib.crc32(url.encode('utf-8')) % self.probe_every == 0
+
+    def needs_render(self, html: str, parsed: Dict) -> bool:
+        """Content heuristic: does the static HTML lack the article we are looking for?
+
+        Args:
+            html: Raw HTML of the page
+            parsed: The page as returned by html_pipeline.parse_html
+        """
+        if len(parsed['clean_text']) < self.min_text_chars * 5:
+            lowered = html.lower()
+            if any(marker in lowered for marker in JS_SHELL_MARKERS):
+                return True
+        if not parsed['title']:
+            return True
+        return len(parsed['text']) < self.min_text_chars
+
+    def record(self, url: str, escalated: bool):
+        """Record whether a page on this URL's domain needed the browser."""
+        domain = urlparse(url).netloc
+        stats = self.domains.setdefault(domain, {'static': 0, 'escalated': 0})
+        was_render_first = self._render_first_domain(url)
+        stats['escalated' if escalated else 'static'] += 1
+        if was_render_first and not escalated:
+            # A probe found complete static content; let past escalations fade quickly
+            stats['escalated'] //= 2
+        if self._render_first_domain(url) and not was_render_first:
+            logging.info(f"Rendering {domain} in the browser from now on")
+        elif was_render_first and not self._render_first_domain(url):
+            logging.info(f"Static pages of {domain} are complete again, fetching them statically")
+
+    def merge(self, counts: Dict[str, Dict[str, int]]):
+        """Add decisions recorded elsewhere, e.g. by crawl worker processes."""
+        for domain, delta in counts.items():
+            stats = self.domains.setdefault(domain, {'static': 0, 'escalated': 0})
+            for key in ('static', 'escalated'):
+                stats[key] += delta.get(key, 0)
+
+    def save(self):
+        with open(self.state_file, 'w') as f:
+            json.dump(self.domains, f, indent=2)
@@ -0,0 +1,121 @@
+import os
+import csv
+import json
+import logging
+from contextlib import contextmanager
+from typing import Dict, Iterator, List
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+
+class ResultsStore:
+    """Append-only JSONL log of scraped articles.
+
+    Every article is appended as one line and flushed to disk, so persisting
+    a result costs O(1) regardless of how many results exist. The JSON and
+    CSV files the rest of the project reads are regenerated from the log
+    only on compaction, which happens every ``compact_every`` appends and
+    whenever ``compact`` is called explicitly.
+
+    With ``shared=True`` several processes may append to the same log:
+    appends take an exclusive file lock and periodic compaction is left to
+    the coordinating process.
+    """
+
+    def __init__(self, log_file: str, json_file: str, csv_file: str, compact_every: int = 50,
+                 shared: bool = False):
+        self.log_file = log_file
+        self.json_file = json_file
+        self.csv_file = csv_file
+        self.compact_every = compact_every
+        self.shared = shared
+        self.appends_since_compaction = 0
+        self.log_checked = False
+
+    def iter_records(self) -> Iterator[Dict]:
+        """Stream stored articles from the log, oldest first."""
+        if not os.path.exists(self.log_file):
+            return
+        with open(self.log_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError:
+                    # A crash mid-write can leave a truncated last line
+                    logging.warning(f"Skipping corrupt line in {self.log_file}")
+
+    def load(self) -> List[Dict]:
+        """Load all stored articles, migrating a legacy JSON file if no log exists yet."""
+        if not os.path.exists(self.log_file) and os.path.exists(self.json_file):
+            try:
+                with open(self.json_file, 'r') as f:
+                    legacy_results = json.load(f)
+            except json.JSONDecodeError:
+                logging.warning(f"Could not load {self.json_file}, starting with empty results")
+                return []
+            self._write_log(legacy_results)
+            logging.info(f"Migrated {len(legacy_results)} results from {self.json_file} to {self.log_file}")
+        return list(self.iter_records())
+
+    def append(self, article: Dict, results: List[Dict]):
+        """Durably append one article and compact periodically."""
+        with open(self.log_file, 'a', encoding='utf-8') as f, self._locked(f):
+            prefix = '' if self.log_checked and not self.shared else self._terminate_partial_line()
+            self.log_checked = True
+            f.write(prefix + json.dumps(article, ensure_ascii=False) + '\n')
+            f.flush()
+            os.fsync(f.fileno())
+        self.appends_since_compaction += 1
+        if not self.shared and self.appends_since_compaction >= self.compact_every:
+            self.compact(results)
+
+    @contextmanager
+    def _locked(self, f):
+        """Hold an exclusive lock on the open log while other processes may append to it."""
+        if not self.shared or fcntl is None:
+            yield
+            return
+        fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+    def compact(self, results: List[Dict]):
+        """Regenerate the JSON and CSV files from the current results."""
+        self._atomic_write(self.json_file, lambda f: json.dump(results, f, indent=2))
+        if results:
+            def write_csv(f):
+                writer = csv.DictWriter(f, fieldnames=results[0].keys())
+                writer.writeheader()
+                writer.writerows(results)
+            self._atomic_write(self.csv_file, write_csv, newline='')
+        self.appends_since_compaction = 0
+
+    def _terminate_partial_line(self) -> str:
+        """Return a newline if the log ends in a line truncated by a crash."""
+        if not os.path.exists(self.log_file) or os.path.getsize(self.log_file) == 0:
+            return ''
+        with open(self.log_file, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return '' if f.read(1) == b'\n' else '\n'
+
+    def _write_log(self, results: List[Dict]):
+        def write_lines(f):
+            for article in results:
+                f.write(json.dumps(article, ensure_ascii=False) + '\n')
+        self._atomic_write(self.log_file, write_lines, encoding='utf-8')
+
+    def _atomic_write(self, path: str, write, **open_kwargs):
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', **open_kwargs) as f:
+            write(f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
@@ -0,0 +1,167 @@
+import time
+import logging
+import threading
+from typing import Dict, List, Optional
+from urllib.parse import urlparse
+from urllib.robotparser import RobotFileParser
+import requests
+
+# Responses that mean the host wants us to slow down
+THROTTLE_STATUSES = (429, 503)
+# Fetch error of URLs that robots.txt does not allow
+ROBOTS_DISALLOWED = 'disallowed by robots.txt'
+
+
+class PageUnavailable(Exception):
+    """Raised for a URL that neither retrying nor rendering can fetch, e.g. a 404."""
+
+
+class RobotsDisallowed(PageUnavailable):
+    """Raised for a URL that robots.txt does not allow fetching."""
+
+
+class TokenBucket:
+    """Thread-safe token bucket whose refill rate adapts to throttling.
+
+    ``reserve`` books the next token and returns how long the caller has to
+    wait for it, so callers can sleep without holding a lock (or a thread).
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self.lock = threading.Lock()
+
+    def reserve(self) -> float:
+        with self.lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(wait, self.paused_until - now)
+
+    def slow_down(self, retry_after: Optional[float] = None):
+        """Halve the rate and pause the host after a throttling response."""
+        with self.lock:
+            self.rate = max(self.base_rate / 16, self.rate / 2)
+            pause = retry_after if retry_after is not None else 1 / self.rate
+            self.paused_until = max(self.paused_until, time.monotonic() + pause)
+
+    def speed_up(self):
+        """Recover the rate additively after a successful response."""
+        with self.lock:
+            self.rate = min(self.base_rate, self.rate + self.base_rate / 10)
+
+
+class CrawlScheduler:
+    """Per-host politeness: token-bucket rate limits, throttling backoff and robots.txt.
+
+    Every host gets its own token bucket, limited further by the host's
+    robots.txt Crawl-delay. 429 and 503 responses halve that host's rate
+    (honouring Retry-After) and successes slowly restore it, so no single
+    host is pushed into blocking us while other hosts keep being crawled.
+    robots.txt is fetched once per host and cached.
+    """
+
+    def __init__(self, rate: float = 2.0, burst: float = 4, user_agent: str = 'Mozilla/5.0',
+                 respect_robots: bool = True, timeout: float = 10):
+        self.rate = rate
+        self.burst = burst
+        self.user_agent = user_agent
+        self.respect_robots = respect_robots
+        self.timeout = timeout
+        self.session = requests.Session()
+        self.session.headers.update({'User-Agent': user_agent})
+        self.buckets: Dict[str, TokenBucket] = {}
+        self.robots: Dict[str, Optional[RobotFileParser]] = {}
+        self.lock = threading.Lock()
+        self.host_locks: Dict[str, threading.Lock] = {}
+
+    def _robots(self, url: str) -> Optional[RobotFileParser]:
+        """Fetch and cache robots.txt for the URL's host; None means no usable robots.txt."""
+        parsed = urlparse(url)
+        host = parsed.netloc
+        with self.lock:
+            host_lock = self.host_locks.setdefault(host, threading.Lock())
+        with host_lock:
+            if host in self.robots:
+                return self.robots[host]
+            parser = None
+            robots_url = f"{parsed.scheme}://{host}/robots.txt"
+            try:
+                response = self.session.get(robots_url, timeout=self.timeout)
+                if response.status_code == 200:
+                    parser = RobotFileParser(robots_url)
+                    parser.parse(response.text.splitlines())
+            except requests.RequestException as e:
+                logging.info(f"Could not fetch {robots_url}: {str(e)}")
+            self.robots[host] = parser
+            return parser
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = urlparse(url).netloc
+        with self.lock:
+            bucket = self.buckets.get(host)
+        if bucket is not None:
+            return bucket
+        rate = self.rate
+        robots = self._robots(url) if self.respect_robots else None
+        crawl_delay = robots.crawl_delay(self.user_agent) if robots else None
+        if crawl_delay:
+            rate = min(rate, 1 / float(crawl_delay))
+            logging.info(f"Using robots.txt crawl delay of {crawl_delay}s for {host}")
+        with self.lock:
+            return self.buckets.setdefault(host, TokenBucket(rate, max(1, min(self.burst, rate * self.burst))))
+
+    def allowed(self, url: str) -> bool:
+        """Whether robots.txt allows fetching the URL."""
+        if not self.respect_robots:
+            return True
+        robots = self._robots(url)
+        return robots is None or robots.can_fetch(self.user_agent, url)
+
+    def site_maps(self, url: str) -> List[str]:
+        """Sitemap URLs listed in the host's robots.txt."""
+        robots = self._robots(url)
+        return (robots.site_maps() or []) if robots else []
+
+    def reserve(self, url: str) -> float:
+        """Book a request slot for the URL's host, returning the seconds to wait for it."""
+        return self.bucket(url).reserve()
+
+    def wait(self, url: str):
+        """Blocking variant of reserve for callers outside the event loop, e.g. Selenium."""
+        delay = self.reserve(url)
+        if delay > 0:
+            time.sleep(delay)
+
+    def record(self, url: str, status: Optional[int], headers: Optional[Dict] = None):
+        """Adapt the host's rate to the response status."""
+        bucket = self.bucket(url)
+        if status in THROTTLE_STATUSES:
+            retry_after = (headers or {}).get('Retry-After')
+            try:
+                retry_after = float(retry_after) if retry_after is not None else None
+            except ValueError:
+                retry_after = None  # HTTP-date form, fall back to the computed backoff
+            bucket.slow_down(retry_after)
+            logging.info(f"Throttled by {urlparse(url).netloc} ({status}), slowing down to {bucket.rate:.2f} req/s")
+        elif status is not None and status < 400:
+            bucket.speed_up()
+
+    @staticmethod
+    def interleave(urls: List[str]) -> List[str]:
+        """Order URLs round-robin across hosts so no host gets a long burst."""
+        by_host: Dict[str, List[str]] = {}
+        for url in urls:
+            by_host.setdefault(urlparse(url).netloc, []).append(url)
+        queues = list(by_host.values())
+        ordered = []
+        for i in range(max((len(q) for q in queues), default=0)):
+            ordered.extend(q[i] for q in queues if i < len(q))
+        return ordered
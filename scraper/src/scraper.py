@@ -1,13 +1,9 @@
 import os
 import time
-import json
 import logging
 from datetime import datetime
 from typing import List, Dict, Optional
-from urllib.parse import urljoin, urlparse
 import pandas as pd
-from bs4 import BeautifulSoup
-import requests
 from selenium import webdriver
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
@@ -17,15 +13,33 @@ from selenium.webdriver.support import expected_conditions as EC
 from newspaper import Article
 from tqdm import tqdm
 from dotenv import load_dotenv
-from selenium.common.exceptions import WebDriverException, SessionNotCreatedException
+from selenium.common.exceptions import WebDriverException, SessionNotCreatedException, TimeoutException
 import platform
 import subprocess
 import shutil
 import random
-from tenacity import retry, stop_after_attempt, wait_exponential
-import csv
 import nltk
 import re
+import queue
+import multiprocessing
+from multiprocessing.util import Finalize
+from fetcher import AsyncFetcher
+from scheduler import CrawlScheduler, PageUnavailable, RobotsDisallowed, ROBOTS_DISALLOWED
+from http_cache import HttpCache
+from driver_pool import DriverPool
+from results_store import ResultsStore
+from url_index import UrlIndex
+from page_cache import PageCache
+from page_store import PageStore
+from backfill import FailureLog, classify_failure
+from metrics import CrawlMetrics
+from link_harvester import LinkFilter, harvest_links
+from feed_discovery import FeedDiscovery
+from render_policy import RenderPolicy, BOT_WALL_STATUSES
+from term_matcher import TermMatcher
+from frontier import CrawlFrontier, LISTING_DEPTH, ARTICLE_DEPTH
+from html_pipeline import parse_html, DEFAULT_PARSER
+from metadata import parse_iso_date, date_from_url
 
 # Set up logging
 logging.basicConfig(
@@ -41,7 +55,15 @@ logging.basicConfig(
 load_dotenv()
 
 class PartnershipScraper:
-    def __init__(self):
+    def __init__(self, worker: bool = False):
+        """
+        Args:
+            worker: Run as one of several crawl processes sharing the URL index,
+                results log and frontier (see run_parallel).
+        """
+        self.worker = worker
+        # Per-stage timings and fetch counters by company and domain
+        self.metrics = CrawlMetrics()
         self.companies = [
             ("SAP", [
                 "https://news.sap.com/",
@@ -170,13 +192,51 @@ class PartnershipScraper:
             "strategic alliance", "SAP BDC", "Business Data Cloud",
             "SAP Databricks"
         ]
+        self.term_matcher = TermMatcher({'search_term': self.search_terms})
         
         self.results_file = "partnership_articles.json"
         self.csv_file = "partnership_articles.csv"
+        self.results_log_file = "partnership_articles.jsonl"
+        self.results_store = ResultsStore(self.results_log_file, self.results_file, self.csv_file, shared=worker)
+        self.url_index_file = "processed_urls.sqlite"
+        self.processed_urls = UrlIndex(self.url_index_file, shared=worker)
+        self.frontier_file = "crawl_frontier.sqlite"
+        self.frontier = CrawlFrontier(self.frontier_file)
         self.setup_logging()
         self.results = self.load_existing_results()
         self.min_date = datetime(2021, 1, 1)
-        self.processed_urls = set()
+        self.http_cache = HttpCache("http_cache", max_bytes=500 * 1024 * 1024)
+        self.scheduler = CrawlScheduler(rate=2.0, burst=4, user_agent='Mozilla/5.0')
+        self.fetcher = AsyncFetcher(max_concurrency=16, per_host_limit=4, timeout=10, cache=self.http_cache,
+                                    scheduler=self.scheduler)
+        # Each worker process gets its own browser
+        self.driver_pool = DriverPool(self.setup_driver, max_size=1 if worker else 2, max_pages=50)
+        self.page_cache = PageCache(max_entries=1000)
+        # Seconds a rendered page may take to finish loading
+        self.render_wait = 5
+        # Plain text of every saved page, read by the content analyzer
+        self.page_store = PageStore("page_store")
+        # Pages the webpage backfill could not save, kept across runs
+        self.backfill_failures = FailureLog("backfill_failures.json")
+        self.render_policy = RenderPolicy("render_domains.json")
+        # HTML parser backend: 'lxml' (fast) or 'html.parser'
+        self.html_parser = DEFAULT_PARSER
+        # Discover articles from RSS/Atom feeds and sitemaps before rendering listings
+        self.use_feed_discovery = True
+        self.feed_discovery = FeedDiscovery(self.fetcher, self.min_date)
+        # Limits for scrolling infinite-scroll listing pages
+        self.scroll_budget = {
+            'max_scrolls': 20,     # scroll steps per listing page
+            'max_links': 500,      # stop once this many same-domain links are loaded
+            'max_seconds': 30,     # total time per listing page
+            'idle_timeout': 1.5,   # seconds to wait for the page to grow after a scroll
+            'patience': 2          # consecutive scrolls without new links before stopping
+        }
+        # Per-company overrides for which harvested links count as articles, e.g.
+        # {"SAP": {"article_pattern": r"/\d{4}/\d{2}/"}}. Keys are the LinkFilter arguments.
+        self.link_rules: Dict[str, Dict] = {}
+        # Set in worker processes to report progress to the coordinating process
+        self.progress_queue = None
 
     def setup_logging(self):
         logging.basicConfig(
@@ -189,32 +249,34 @@ class PartnershipScraper:
         )
 
     def load_existing_results(self) -> List[Dict]:
-        if os.path.exists(self.results_file):
-            try:
-                with open(self.results_file, 'r') as f:
-                    results = json.load(f)
-                    # Initialize processed_urls with existing URLs
-                    self.processed_urls = {article['url'] for article in results}
-                    logging.info(f"Loaded {len(results)} existing results")
-                    return results
-            except json.JSONDecodeError:
-                logging.warning(f"Could not load {self.results_file}, starting with empty results")
-        logging.info("Loaded 0 existing results")
-        return []
+        results = self.results_store.load()
+        # Make sure every stored article is in the processed URL index
+        self.processed_urls.update(article['url'] for article in results)
+        logging.info(f"Loaded {len(results)} existing results")
+        return results
 
     def save_results(self):
-        # Save to JSON
-        with open(self.results_file, 'w') as f:
-            json.dump(self.results, f, indent=2)
+        """Compact the append-only results log into the JSON and CSV files."""
+        with self.metrics.timer('save_results'):
+            self.results_store.compact(self.results)
+        logging.info(f"Saved {len(self.results)} articles to {self.results_file} and {self.csv_file}")
+
+    def append_result(self, article_data: Dict) -> bool:
+        """Persist a single new article without rewriting existing results.
         
-        # Save to CSV
-        if self.results:
-            with open(self.csv_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.results[0].keys())
-                writer.writeheader()
-                writer.writerows(self.results)
+        The URL is claimed in the processed URL index first, so an article
+        another worker stored in the meantime is not stored twice.
         
-        logging.info(f"Saved {len(self.results)} articles to {self.results_file} and {self.csv_file}")
+        Returns:
+            False if the article's URL was already processed
+        """
+        if not self.processed_urls.add(article_data['url']):
+            logging.info(f"Skipping duplicate article: {article_data['url']}")
+            return False
+        self.results.append(article_data)
+        self.results_store.append(article_data, self.results)
+        if self.progress_queue is not None:
+            self.progress_queue.put(('article', article_data['company']))
 
     def setup_driver(self) -> webdriver.Chrome:
         chrome_options = Options()
@@ -225,47 +287,95 @@ class PartnershipScraper:
         chrome_options.add_argument("--window-size=1920,1080")
         chrome_options.add_argument("--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36")
         
-        driver = webdriver.Chrome(options=chrome_options)
+        with self.metrics.timer('setup_driver'):
+            driver = webdriver.Chrome(options=chrome_options)
         driver.set_page_load_timeout(30)
         logging.info("WebDriver setup successful")
         return driver
 
-    def normalize_url(self, base_url: str, url: str) -> str:
-        if not url:
-            return ""
-        if url.startswith("//"):
-            return f"https:{url}"
-        return urljoin(base_url, url)
-
-    def is_valid_url(self, url: str) -> bool:
+    def wait_for_page_growth(self, driver: webdriver.Chrome, last_height: int, timeout: float) -> bool:
+        """Wait until the document grows past last_height, returning False if it stays idle."""
         try:
-            result = urlparse(url)
-            return all([result.scheme, result.netloc])
-        except:
+            WebDriverWait(driver, timeout, poll_frequency=0.1).until(
+                lambda d: d.execute_script("return document.body.scrollHeight") > last_height
+            )
+            return True
+        except TimeoutException:
             return False
 
-    @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10))
     def scroll_page(self, driver: webdriver.Chrome):
+        """Scroll an infinite-scroll listing until it stops yielding new article links.
+        
+        Each scroll waits only as long as the DOM keeps growing, and the whole
+        loop is capped by the limits in self.scroll_budget.
+        """
+        budget = self.scroll_budget
+        deadline = time.monotonic() + budget['max_seconds']
         try:
-            last_height = driver.execute_script("return document.body.scrollHeight")
-            while True:
+            seen_links = set(harvest_links(driver, same_host_only=True))
+            stale_rounds = 0
+            for _ in range(budget['max_scrolls']):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or len(seen_links) >= budget['max_links']:
+                    break
+                last_height = driver.execute_script("return document.body.scrollHeight")
                 driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-                time.sleep(2)
-                new_height = driver.execute_script("return document.body.scrollHeight")
-                if new_height == last_height:
+                if not self.wait_for_page_growth(driver, last_height, min(budget['idle_timeout'], remaining)):
+                    break
+                links = set(harvest_links(driver, same_host_only=True))
+                new_links = links - seen_links
+                seen_links |= links
+                stale_rounds = 0 if new_links else stale_rounds + 1
+                if stale_rounds >= budget['patience']:
                     break
-                last_height = new_height
         except Exception as e:
             logging.error(f"Error scrolling page: {str(e)}")
-            raise
+
+    def link_filter_for(self, company: str, url: str) -> LinkFilter:
+        """Build the article link filter for a listing page of the given company."""
+        return LinkFilter(url, **self.link_rules.get(company, {}))
+
+    def discover_article_links(self, company: str, url: str) -> List[str]:
+        """Collect candidate article links for a listing page.
+        
+        Feeds and sitemaps are used when available; the listing page is only
+        rendered and scrolled in the browser when they list no article links.
+        """
+        link_filter = self.link_filter_for(company, url)
+        if self.use_feed_discovery:
+            listing_page = self.page_cache.get(url)
+            entries = self.feed_discovery.discover(url, listing_page['html'] if listing_page else None)
+            if entries is not None:
+                links = link_filter.filter([entry['url'] for entry in entries])
+                if links:
+                    return links
+                logging.info(f"Feeds and sitemaps of {url} list no articles, rendering the listing")
+        
+        if not self.scheduler.allowed(url):
+            logging.info(f"Skipping {url}, disallowed by robots.txt")
+            return []
+        self.scheduler.wait(url)
+        with self.driver_pool.lease() as driver:
+            self.metrics.count('requests', url)
+            with self.metrics.timer('driver_get', url):
+                driver.get(url)
+            with self.metrics.timer('scroll', url):
+                self.scroll_page(driver)
+            links = harvest_links(driver)
+        return link_filter.filter(links)
 
     def is_article_duplicate(self, url: str) -> bool:
-        """Check if an article with the given URL already exists in results."""
-        return url in self.processed_urls or any(article['url'] == url for article in self.results)
+        """Check if the canonical form of the URL has already been processed."""
+        return url in self.processed_urls
 
     def parse_date(self, date_str: str) -> Optional[datetime]:
         """Parse various date formats and return a datetime object."""
         try:
+            # ISO 8601 timestamps from structured metadata
+            iso_date = parse_iso_date(date_str)
+            if iso_date:
+                return iso_date
+            
             # Common date formats
             formats = [
                 "%Y-%m-%d",
@@ -306,60 +416,64 @@ class PartnershipScraper:
             return False
         return parsed_date >= self.min_date
 
-    def extract_article_data(self, driver: webdriver.Chrome, url: str, company: str) -> Optional[Dict]:
+    def parse_page(self, page: Dict) -> Dict:
+        """Parse a cached page once and keep the result alongside its HTML."""
+        if page.get('parsed') is None:
+            with self.metrics.timer('parse', page['url']):
+                page['parsed'] = parse_html(page['html'], self.html_parser)
+        return page['parsed']
+
+    def article_date(self, parsed: Dict, url: str) -> Optional[str]:
+        """Find an article's publication date, preferring structured metadata.
+        
+        JSON-LD, OpenGraph and <meta> dates are tried first, then the date
+        elements on the page and finally a date in the URL path.
+        """
+        published = parsed['metadata']['published']
+        if published:
+            published_date = self.parse_date(published)
+            if published_date:
+                return published_date.strftime("%Y-%m-%d")
+        for candidate in parsed['date_candidates']:
+            if self.parse_date(candidate):
+                return candidate
+        url_date = date_from_url(url)
+        if url_date:
+            return url_date.strftime("%Y-%m-%d")
+        return None
+
+    def extract_article_data(self, page: Dict, company: str) -> Optional[Dict]:
+        with self.metrics.timer('extract', page['url']):
+            return self._extract_article_data(page, company)
+
+    def _extract_article_data(self, page: Dict, company: str) -> Optional[Dict]:
+        url = page['url']
         try:
-            soup = BeautifulSoup(driver.page_source, 'html.parser')
-            
-            # Try different methods to find the article title
-            title = None
-            for selector in ['h1', 'h2', '.article-title', '.post-title']:
-                title_elem = soup.select_one(selector)
-                if title_elem:
-                    title = title_elem.get_text(strip=True)
-                    break
-            
+            parsed = self.parse_page(page)
+            title = parsed['metadata']['title'] or parsed['title']
             if not title:
                 return None
             
-            # Try different methods to find the article text
-            text = ""
-            for selector in ['article', '.article-content', '.post-content', '.entry-content']:
-                content = soup.select_one(selector)
-                if content:
-                    text = content.get_text(strip=True)
-                    break
+            # Reject undated and old articles before any further work
+            date = self.article_date(parsed, url)
+            if not date:
+                logging.info(f"Skipping article without a publication date: {url}")
+                return None
+            if not self.is_valid_date(date):
+                logging.info(f"Skipping article from {date} (before 2021)")
+                return None
             
-            if not text:
-                paragraphs = soup.find_all('p')
-                text = ' '.join(p.get_text(strip=True) for p in paragraphs)
+            text = parsed['text']
             
             # Check if any search terms are present in title or text
-            matched_terms = []
-            for term in self.search_terms:
-                if term.lower() in title.lower() or term.lower() in text.lower():
-                    matched_terms.append(term)
+            found = self.term_matcher.matched_terms(f"{title}\n{text}").get('search_term', set())
+            matched_terms = [term for term in self.search_terms if term in found]
             
             if not matched_terms:
                 return None
             
             logging.info(f"Found matching terms in text: {matched_terms}")
             
-            # Try to find the date
-            date = None
-            for selector in ['time', '.date', '.article-date', '.post-date']:
-                date_elem = soup.select_one(selector)
-                if date_elem:
-                    date = date_elem.get_text(strip=True)
-                    break
-            
-            if not date:
-                date = datetime.now().strftime("%Y-%m-%d")
-            
-            # Validate the date
-            if not self.is_valid_date(date):
-                logging.info(f"Skipping article from {date} (before 2021)")
-                return None
-            
             return {
                 "company": company,
                 "title": title,
@@ -373,139 +487,311 @@ class PartnershipScraper:
             logging.error(f"Error extracting article data from {url}: {str(e)}")
             return None
 
-    def save_webpage_content(self, url: str, company: str) -> str:
-        """Save webpage content as UTF-16 LE encoded text file.
+    def reject_old_articles(self, urls: List[str]) -> List[str]:
+        """Drop articles that a <head>-only fetch shows to be older than min_date.
+        
+        Only URLs that would otherwise need a full browser render are checked;
+        static pages are cheap enough to fetch whole and are date-checked
+        right after parsing.
+        """
+        to_check = [url for url in urls if url not in self.page_cache and self.page_cache.failure(url) is None
+                    and self.render_policy.render_first(url)]
+        too_old = set()
+        for url, result in self.fetcher.fetch_heads(to_check).items():
+            self.metrics.record_fetch(result, stage='fetch_head')
+            if result['html'] is None:
+                continue
+            try:
+                published = parse_html(result['html'], self.html_parser)['metadata']['published']
+            except Exception as e:
+                # Leave it to the full fetch; a truncated <head> may not parse
+                logging.info(f"Could not parse the <head> of {url}: {str(e)}")
+                continue
+            published_date = self.parse_date(published) if published else None
+            if published_date and published_date < self.min_date:
+                logging.info(f"Skipping article from {published} (before 2021): {url}")
+                too_old.add(url)
+                self.processed_urls.add(url)
+        return [url for url in urls if url not in too_old]
+
+    def prefetch_pages(self, urls: List[str]) -> Dict[str, Dict]:
+        """Fetch all uncached URLs concurrently into the page cache.
+        
+        URLs on domains known to need the browser are left for get_page to render.
+        Failed fetches are kept in the page cache too and not repeated in this run.
+        
+        Returns:
+            The fetch results of the URLs that were fetched, keyed by URL
+        """
+        missing = [url for url in urls if url not in self.page_cache and self.page_cache.failure(url) is None
+                   and not self.render_policy.render_first(url)]
+        results = self.fetcher.fetch_all(missing)
+        for url, result in results.items():
+            self.metrics.record_fetch(result)
+            if result['html'] is not None:
+                self.metrics.count('pages_static', url)
+                self.page_cache.put(url, result['html'], 'static', result['status'],
+                                    result['headers'], result['elapsed'])
+            else:
+                self.page_cache.put_failure(url, result)
+        return results
+
+    def render_page(self, url: str) -> Dict:
+        """Render a page in the browser and store it in the page cache.
+        
+        Raises:
+            RobotsDisallowed: If robots.txt does not allow fetching the URL
+        """
+        if not self.scheduler.allowed(url):
+            raise RobotsDisallowed(f"{url} is disallowed by robots.txt")
+        start = time.monotonic()
+        self.scheduler.wait(url)
+        with self.driver_pool.lease() as driver:
+            self.metrics.count('requests', url)
+            with self.metrics.timer('driver_get', url):
+                driver.get(url)
+            # Wait for the page to load, giving Cloudflare at most render_wait seconds
+            try:
+                WebDriverWait(driver, self.render_wait, poll_frequency=0.1).until(
+                    lambda d: d.execute_script("return document.readyState") == 'complete'
+                    and d.find_elements(By.TAG_NAME, 'body')
+                )
+            except TimeoutException:
+                logging.info(f"{url} did not finish loading within {self.render_wait}s, using it as is")
+            html = driver.page_source
+        self.metrics.observe('render', time.monotonic() - start, url)
+        self.metrics.count('pages_rendered', url)
+        self.metrics.count('bytes_fetched', url, len(html.encode('utf-8')))
+        return self.page_cache.put(url, html, 'rendered', elapsed=time.monotonic() - start)
+
+    def get_page(self, url: str, article: bool = True) -> Dict:
+        """Return a page from the cache, fetching it at most once per run.
+        
+        The static HTML is tried first and only escalated to a Selenium
+        render when the fetch fails transiently or the content heuristic
+        says the article is missing. Only the heuristic and bot walls
+        (401/403) count towards rendering a domain directly. Permanent
+        failures such as 404 and URLs disallowed by robots.txt are never
+        rendered.
+        
+        Args:
+            url: The URL of the page
+            article: Whether the page is an article. The content heuristic
+                only applies to articles; listing pages keep their static HTML.
+        
+        Raises:
+            PageUnavailable: If the fetch failed permanently
+            RobotsDisallowed: If robots.txt does not allow fetching the URL
+        """
+        page = self.page_cache.get(url)
+        if page is None:
+            if self.render_policy.render_first(url):
+                return self.render_page(url)
+            # A static fetch that already failed in this run, e.g. in a prefetched batch, is not repeated
+            result = self.page_cache.failure(url)
+            if result is None:
+                self.prefetch_pages([url])
+                page = self.page_cache.get(url)
+                result = self.page_cache.failure(url)
+            if page is None:
+                if result is not None and result['error'] == ROBOTS_DISALLOWED:
+                    raise RobotsDisallowed(f"{url} is disallowed by robots.txt")
+                if result is not None and classify_failure(result) == 'permanent':
+                    raise PageUnavailable(f"{url} failed permanently with status {result['status']}")
+                if result is not None and result['status'] in BOT_WALL_STATUSES:
+                    self.render_policy.record(url, escalated=True)
+                logging.info(f"Requests failed for {url}, trying with Selenium")
+                return self.render_page(url)
+        if article and page['source'] == 'static' and not page.get('render_checked'):
+            page['render_checked'] = True
+            escalate = self.render_policy.needs_render(page['html'], self.parse_page(page))
+            self.render_policy.record(url, escalated=escalate)
+            if escalate:
+                logging.info(f"Static content of {url} looks incomplete, rendering with Selenium")
+                return self.render_page(url)
+        return page
+
+    def save_webpage_content(self, url: str, company: str, refresh: bool = False,
+                             article: bool = True) -> Optional[str]:
+        """Save a webpage's clean text to the page store.
         
         Args:
             url: The URL of the webpage
-            company: The company name for the filename
+            company: The company the page was collected for
+            refresh: Store the page again even if it is already stored
+            article: Whether the page is an article rather than a listing page
             
         Returns:
-            The path to the saved file
+            The content hash of the stored text, or None on failure
         """
         try:
-            # Create a safe filename from the URL
-            safe_url = url.replace('https://', '').replace('http://', '').replace('/', '_')
-            filename = f"webpage_content/{company}_{safe_url}.txt"
-            
-            # Skip if file already exists
-            if os.path.exists(filename):
-                logging.info(f"File already exists, skipping: {filename}")
-                return filename
-            
-            # Ensure the directory exists
-            os.makedirs("webpage_content", exist_ok=True)
-            
-            # First try with requests
-            try:
-                response = requests.get(url, headers={'User-Agent': 'Mozilla/5.0'}, timeout=10)
-                response.raise_for_status()
-                html_content = response.text
-            except (requests.Timeout, requests.RequestException) as e:
-                logging.info(f"Requests failed for {url}, trying with Selenium: {str(e)}")
-                # If requests fails, try with Selenium
-                driver = self.setup_driver()
-                try:
-                    driver.get(url)
-                    # Wait for the page to load
-                    time.sleep(5)  # Give time for Cloudflare to process
-                    html_content = driver.page_source
-                finally:
-                    driver.quit()
-            
-            # Parse with BeautifulSoup to get clean text
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
-            
-            # Get text content
-            text = soup.get_text()
-            
-            # Clean up whitespace
-            lines = (line.strip() for line in text.splitlines())
-            chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-            text = '\n'.join(chunk for chunk in chunks if chunk)
+            # Skip if the page is already stored
+            entry = None if refresh else self.page_store.entry(url, company)
+            if entry is not None:
+                logging.info(f"Page already stored, skipping: {url}")
+                return entry['hash']
             
-            # Save as UTF-16 LE
-            with open(filename, 'w', encoding='utf-16le') as f:
-                f.write(text)
+            # Clean text without scripts and styles, from the shared parse
+            text = self.parse_page(self.get_page(url, article))['clean_text']
             
-            logging.info(f"Saved webpage content to {filename}")
-            return filename
+            with self.metrics.timer('save_page', url):
+                digest = self.page_store.put(url, company, text)
+            logging.info(f"Saved webpage content of {url} to the page store")
+            return digest
             
+        except PageUnavailable as e:
+            logging.info(f"Not saving page: {str(e)}")
+            return None
         except Exception as e:
             logging.error(f"Error saving webpage content from {url}: {str(e)}")
             return None
 
-    def save_all_processed_webpages(self):
-        """Save content of all processed URLs as UTF-16 LE encoded text files."""
+    def import_webpage_content(self, directory: str = "webpage_content"):
+        """Import the text files earlier versions saved pages to into the page store."""
+        urls_by_company = {company: list(urls) for company, urls in self.companies}
+        for article in self.results:
+            urls_by_company.setdefault(article['company'], []).append(article['url'])
+        imported = self.page_store.import_text_files(directory, urls_by_company)
+        if imported:
+            logging.info(f"Imported {imported} pages from {directory} into the page store")
+
+    def save_all_processed_webpages(self, max_age_days: Optional[float] = 30, batch_size: int = 64,
+                                    retry_permanent: bool = False):
+        """Backfill the page store with the content of all processed URLs.
+        
+        Only pages that are missing from the store or older than max_age_days
+        are fetched, concurrently in batches. Failed pages are kept in the
+        failure list: transient failures are retried on the next run,
+        permanent ones (404, 410, robots.txt, ...) are skipped.
+        
+        Args:
+            max_age_days: Refetch stored pages older than this; None never refetches
+            batch_size: Pages fetched concurrently per batch
+            retry_permanent: Also retry pages that failed permanently before
+        """
         try:
-            for article in self.results:
-                url = article['url']
-                company = article['company']
-                self.save_webpage_content(url, company)
+            cutoff = time.time() - max_age_days * 86400 if max_age_days is not None else None
+            todo = []
+            for url, company in dict.fromkeys((article['url'], article['company']) for article in self.results):
+                if not retry_permanent and self.backfill_failures.is_permanent(url):
+                    continue
+                entry = self.page_store.entry(url, company)
+                if entry is not None and (cutoff is None or entry['fetched_at'] >= cutoff):
+                    continue
+                todo.append((url, company, entry is not None))
+            
+            if not todo:
+                logging.info("All processed webpages are saved and fresh")
+                return
+            
+            saved = 0
+            with tqdm(total=len(todo), desc="Saving webpages") as pbar:
+                for start in range(0, len(todo), batch_size):
+                    batch = todo[start:start + batch_size]
+                    fetched = self.prefetch_pages([url for url, _, _ in batch])
+                    for url, company, stale in batch:
+                        result = fetched.get(url) or self.page_cache.failure(url)
+                        if result is not None and result['html'] is None and classify_failure(result) == 'permanent':
+                            self.backfill_failures.record(url, company, 'permanent', result['status'], result['error'])
+                        elif self.save_webpage_content(url, company, refresh=stale):
+                            self.backfill_failures.clear(url)
+                            saved += 1
+                        else:
+                            status, error = (result['status'], result['error']) if result else (None, None)
+                            self.backfill_failures.record(url, company, 'transient', status, error)
+                        pbar.update(1)
+                    self.backfill_failures.save()
+            
+            counts = self.backfill_failures.counts()
+            logging.info(f"Saved {saved} of {len(todo)} webpages; failure list has {counts['transient']} "
+                         f"transient and {counts['permanent']} permanent failures")
         except Exception as e:
             logging.error(f"Error saving processed webpages: {str(e)}")
 
     def search_company_news(self, company: str, urls: List[str]):
-        driver = None
+        """Crawl a company's listing pages and articles through the persistent frontier."""
+        self.metrics.company = company
         try:
-            driver = self.setup_driver()
-            for url in urls:
-                logging.info(f"Scraping {company} - {url}")
-                try:
-                    # Save the webpage content
-                    self.save_webpage_content(url, company)
-                    
-                    driver.get(url)
-                    self.scroll_page(driver)
-                    
-                    # Find all article links
-                    links = []
-                    for tag in ['a', 'h2', 'h3']:
-                        elements = driver.find_elements(By.TAG_NAME, tag)
-                        for elem in elements:
-                            href = elem.get_attribute('href')
-                            if href and self.is_valid_url(href):
-                                links.append(href)
-                    
-                    logging.info(f"Found {len(links)} potential articles on {url}")
-                    
-                    # Process each article
-                    for link in links:
-                        # Skip if we've already processed this URL
-                        if self.is_article_duplicate(link):
-                            logging.info(f"Skipping duplicate article: {link}")
-                            continue
-                            
-                        try:
-                            # Save the article content
-                            self.save_webpage_content(link, company)
-                            
-                            driver.get(link)
-                            article_data = self.extract_article_data(driver, link, company)
-                            if article_data:
-                                self.results.append(article_data)
-                                self.processed_urls.add(link)
-                                self.save_results()  # Save after each successful article
-                        except Exception as e:
-                            logging.error(f"Error processing article {link}: {str(e)}")
-                            continue
-                            
-                except Exception as e:
-                    logging.error(f"Error scraping {company} - {url}: {str(e)}")
-                    continue
+            self.frontier.add(company, urls, LISTING_DEPTH)
+            # Finish articles discovered before an interruption first
+            self.process_article_queue(company)
+            
+            # Failed listings go back to pending, so claim until none are left
+            while True:
+                # Fetch all pending listing pages concurrently up front
+                listings = self.frontier.claim(company, LISTING_DEPTH)
+                if not listings:
+                    break
+                self.prefetch_pages([item['url'] for item in listings])
+                for item in listings:
+                    url = item['url']
+                    logging.info(f"Scraping {company} - {url}")
+                    try:
+                        # Save the webpage content
+                        self.save_webpage_content(url, company, article=False)
+
+                        # Find all article links, from feeds if the site has them
+                        links = self.discover_article_links(company, url)
+
+                        logging.info(f"Found {len(links)} potential articles on {url}")
+
+                        # Skip articles we've already processed
+                        new_links = []
+                        for link in links:
+                            if self.is_article_duplicate(link):
+                                logging.info(f"Skipping duplicate article: {link}")
+                                continue
+                            new_links.append(link)
+
+                        self.frontier.add(company, new_links, ARTICLE_DEPTH, parent=url)
+                        self.frontier.mark_done(item)
+                        self.process_article_queue(company)
+
+                    except Exception as e:
+                        logging.error(f"Error scraping {company} - {url}: {str(e)}")
+                        self.frontier.mark_failed(item)
+                        continue
                     
         except Exception as e:
             logging.error(f"Error in search_company_news for {company}: {str(e)}")
-        finally:
-            if driver:
+
+    def process_article_queue(self, company: str, batch_size: int = 32):
+        """Process a company's queued articles in concurrently fetched batches."""
+        while True:
+            batch = self.frontier.claim(company, ARTICLE_DEPTH, limit=batch_size)
+            if not batch:
+                break
+            
+            # Reject old articles from their metadata, then fetch the rest concurrently
+            fresh_links = set(self.reject_old_articles([item['url'] for item in batch]))
+            self.prefetch_pages([item['url'] for item in batch if item['url'] in fresh_links])
+            
+            # Process each article from the page cache
+            for item in batch:
+                link = item['url']
+                if link not in fresh_links or self.is_article_duplicate(link):
+                    self.frontier.mark_done(item)
+                    continue
                 try:
-                    driver.quit()
-                except:
-                    pass
+                    page = self.get_page(link)
+                    
+                    # Save the article content
+                    self.save_webpage_content(link, company)
+                    
+                    article_data = self.extract_article_data(page, company)
+                    if article_data:
+                        self.append_result(article_data)  # Persist each successful article
+                    else:
+                        # Don't revisit articles that didn't match either
+                        self.processed_urls.add(link)
+                    self.frontier.mark_done(item)
+                except PageUnavailable as e:
+                    logging.info(f"Skipping article: {str(e)}")
+                    self.processed_urls.add(link)
+                    self.frontier.mark_done(item)
+                except Exception as e:
+                    logging.error(f"Error processing article {link}: {str(e)}")
+                    self.frontier.mark_failed(item)
 
     def filter_companies(self, company_names: List[str]) -> List[tuple]:
         """Filter companies by their names.
@@ -525,20 +811,127 @@ class PartnershipScraper:
                 logging.info(f"Excluded company: {company}")
         return filtered_companies
 
-    def run(self, selected_companies: Optional[List[str]] = None):
+    def run(self, selected_companies: Optional[List[str]] = None, resume: bool = True):
         """Run the scraper for all companies or selected companies.
         
         Args:
             selected_companies: Optional list of company names to scrape. If None, all companies will be scraped.
+            resume: Continue an interrupted crawl from the frontier instead of starting over.
         """
         companies_to_scrape = self.filter_companies(selected_companies) if selected_companies else self.companies
+        self.prepare_frontier(resume)
         
         with tqdm(total=len(companies_to_scrape), desc="Scraping companies") as pbar:
             for company, urls in companies_to_scrape:
+                if self.frontier.company_state(company) == 'done':
+                    logging.info(f"Skipping {company}, already finished in this crawl")
+                    pbar.update(1)
+                    continue
                 logging.info(f"\nScraping {company}...")
                 self.search_company_news(company, urls)
                 self.save_results()
+                self.render_policy.save()
+                self.save_metrics()
                 pbar.update(1)
+        self.frontier.mark_complete()
+        self.driver_pool.close()
+
+    def save_metrics(self):
+        """Write the JSON run report and the Prometheus snapshot of the crawl metrics."""
+        self.metrics.save("crawl_report.json", "crawl_metrics.prom")
+
+    def prepare_frontier(self, resume: bool):
+        """Continue an interrupted crawl from the frontier, or start a fresh one."""
+        if resume and self.frontier.has_unfinished():
+            requeued = self.frontier.resume()
+            logging.info(f"Resuming interrupted crawl ({requeued} items requeued)")
+        else:
+            self.frontier.clear()
+
+    def run_parallel(self, selected_companies: Optional[List[str]] = None, workers: int = 4, resume: bool = True):
+        """Run the scraper with companies sharded across worker processes.
+        
+        Each worker has its own fetcher and browser and crawls one company at
+        a time. Workers share the URL index, the results log and the frontier,
+        so duplicates are skipped across processes and an interrupted run
+        resumes like a serial one. Progress is shown in a single bar here.
+        
+        Args:
+            selected_companies: Optional list of company names to scrape. If None, all companies will be scraped.
+            workers: Number of crawl processes.
+            resume: Continue an interrupted crawl from the frontier instead of starting over.
+        """
+        companies_to_scrape = self.filter_companies(selected_companies) if selected_companies else self.companies
+        self.prepare_frontier(resume)
+        
+        pending = []
+        for company, urls in companies_to_scrape:
+            if self.frontier.company_state(company) == 'done':
+                logging.info(f"Skipping {company}, already finished in this crawl")
+                continue
+            pending.append((company, urls))
+        
+        # Spawn rather than fork: the parent holds SQLite connections and HTTP sessions
+        context = multiprocessing.get_context('spawn')
+        articles = 0
+        complete = True
+        with context.Manager() as manager, tqdm(total=len(companies_to_scrape),
+                                                initial=len(companies_to_scrape) - len(pending),
+                                                desc="Scraping companies") as pbar:
+            progress = manager.Queue()
+            with context.Pool(min(workers, len(pending)) or 1, initializer=_init_worker,
+                              initargs=(progress,)) as pool:
+                tasks = {company: pool.apply_async(_crawl_company, (company, urls)) for company, urls in pending}
+                running = {}  # company -> pid of the worker crawling it
+                lost = set()
+                while any(not task.ready() for company, task in tasks.items() if company not in lost) \
+                        or not progress.empty():
+                    # The task of a worker that died mid-company never becomes ready
+                    alive = {process.pid for process in multiprocessing.active_children()}
+                    for company, pid in list(running.items()):
+                        if pid not in alive:
+                            logging.error(f"Worker process {pid} died while scraping {company}")
+                            del running[company]
+                            lost.add(company)
+                            pbar.update(1)
+                    try:
+                        event, company, *details = progress.get(timeout=0.5)
+                    except queue.Empty:
+                        continue
+                    if event == 'company_started':
+                        running[company] = details[0]
+                    elif event == 'article':
+                        articles += 1
+                        pbar.set_postfix(articles=articles)
+                    elif event == 'company_done':
+                        running.pop(company, None)
+                        pbar.update(1)
+                for company, task in tasks.items():
+                    if company in lost:
+                        complete = False
+                        continue
+                    try:
+                        outcome = task.get()
+                        self.render_policy.merge(outcome['render_policy'])
+                        self.metrics.merge(outcome['metrics'])
+                    except Exception as e:
+                        logging.error(f"Worker failed while scraping {company}: {str(e)}")
+                        complete = False
+                if not lost:
+                    # Let the workers exit normally so they close their browsers
+                    pool.close()
+                    pool.join()
+        
+        # Leave the crawl resumable if a worker crashed
+        if complete:
+            self.frontier.mark_complete()
+
+        # Pick up what the workers stored
+        self.processed_urls.refresh()
+        self.results = self.results_store.load()
+        self.save_results()
+        self.render_policy.save()
+        self.save_metrics()
 
     def save_processed_urls_to_files(self):
         """Save all processed URLs to text files, organized by company."""
@@ -582,10 +975,43 @@ class PartnershipScraper:
         except Exception as e:
             logging.error(f"Error saving URLs to files: {str(e)}")
 
+_worker_scraper: Optional[PartnershipScraper] = None
+
+
+def _init_worker(progress_queue):
+    """Pool initializer: one scraper per worker process, reused for every company."""
+    global _worker_scraper
+    _worker_scraper = PartnershipScraper(worker=True)
+    _worker_scraper.progress_queue = progress_queue
+    # Keep the browser for the worker's lifetime and quit it when the worker exits
+    Finalize(_worker_scraper, _worker_scraper.driver_pool.close, exitpriority=10)
+
+
+def _crawl_company(company: str, urls: List[str]) -> Dict[str, Dict]:
+    """Crawl one company in a worker, returning the render decisions and metrics it recorded."""
+    scraper = _worker_scraper
+    scraper.metrics = CrawlMetrics()
+    before = {domain: dict(stats) for domain, stats in scraper.render_policy.domains.items()}
+    logging.info(f"\nScraping {company}...")
+    scraper.progress_queue.put(('company_started', company, os.getpid()))
+    try:
+        scraper.search_company_news(company, urls)
+    finally:
+        scraper.progress_queue.put(('company_done', company))
+    delta = {}
+    for domain, stats in scraper.render_policy.domains.items():
+        old = before.get(domain, {})
+        delta[domain] = {key: count - old.get(key, 0) for key, count in stats.items()}
+    return {'render_policy': delta, 'metrics': scraper.metrics.snapshot()}
+
+
 if __name__ == "__main__":
     scraper = PartnershipScraper()
     
-    # First, save content of any existing processed URLs
+    # Move pages saved as text files by earlier versions into the page store
+    scraper.import_webpage_content()
+    
+    # Save content of any existing processed URLs
     scraper.save_all_processed_webpages()
     
     # Then run scraper for newly added companies and organizations
@@ -594,7 +1020,13 @@ if __name__ == "__main__":
         "Palantir", "Informatica", "ServiceNow", "NASDAQ", 
         "NYSE", "DAX", "Reuters", "Bloomberg", "Financial Times"
     ]
-    scraper.run(selected_companies=new_companies)
+    workers = int(os.getenv("SCRAPER_WORKERS", "1"))
+    if workers > 1:
+        scraper.run_parallel(selected_companies=new_companies, workers=workers)
+    else:
+        scraper.run(selected_companies=new_companies)
     
     # After scraping, save content of all processed URLs
-    scraper.save_all_processed_webpages() 
\ No newline at end of file
+    scraper.save_all_processed_webpages()
+    scraper.save_metrics()
+    scraper.driver_pool.close() 
\ No newline at end of file
@@ -0,0 +1,75 @@
+from collections import deque
+from typing import Dict, Hashable, Iterable, List, Tuple
+
+
+class TermMatcher:
+    """Aho-Corasick matcher for many terms in one linear pass over a text.
+
+    Terms are grouped by category (any hashable label). Matching is case
+    insensitive and, like a plain ``term in text`` check, finds terms
+    anywhere in the text, including inside longer words. The text is
+    lowercased once per call regardless of how many terms there are.
+
+    Args:
+        terms: Mapping of category to the terms in that category
+    """
+
+    def __init__(self, terms: Dict[Hashable, Iterable[str]]):
+        self.goto: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        # Terms ending at each node, as (term, category, length)
+        self.outputs: List[List[Tuple[str, Hashable, int]]] = [[]]
+        for category, category_terms in terms.items():
+            for term in category_terms:
+                self._add(term, category)
+        self._build_failure_links()
+
+    def _add(self, term: str, category: Hashable):
+        node = 0
+        lowered = term.lower()
+        for char in lowered:
+            next_node = self.goto[node].get(char)
+            if next_node is None:
+                next_node = len(self.goto)
+                self.goto[node][char] = next_node
+                self.goto.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            node = next_node
+        if node:
+            self.outputs[node].append((term, category, len(lowered)))
+
+    def _build_failure_links(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self.goto[node].items():
+                queue.append(child)
+                fallback = self.fail[node]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                # Inherit the terms that end at the failure target
+                self.outputs[child] = self.outputs[child] + self.outputs[self.fail[child]]
+
+    def find_all(self, text: str) -> List[Tuple[str, Hashable, int, int]]:
+        """Return every (term, category, start, end) occurrence in the text."""
+        matches = []
+        goto = self.goto
+        fail = self.fail
+        outputs = self.outputs
+        node = 0
+        for index, char in enumerate(text.lower()):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for term, category, length in outputs[node]:
+                matches.append((term, category, index - length + 1, index + 1))
+        return matches
+
+    def matched_terms(self, text: str) -> Dict[Hashable, set]:
+        """Return the set of distinct terms found in the text, per category."""
+        found: Dict[Hashable, set] = {}
+        for term, category, _, _ in self.find_all(text):
+            found.setdefault(category, set()).add(term)
+        return found
@@ -0,0 +1,122 @@
+import math
+import sqlite3
+import hashlib
+from typing import Iterable
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the visitor and never change the page
+TRACKING_PARAMS = {
+    'gclid', 'fbclid', 'msclkid', 'dclid', 'yclid', 'mc_cid', 'mc_eid',
+    '_hsenc', '_hsmi', 'mkt_tok', 'ref', 'ref_src', 'cmpid', 'sf_id'
+}
+TRACKING_PREFIXES = ('utm_', 'pk_', 'hsa_')
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+MASK_64 = (1 << 64) - 1
+
+
+def canonicalize_url(url: str) -> str:
+    """Reduce a URL to a canonical form so trivially different variants compare equal.
+
+    Lowercases scheme and host, drops default ports, fragments and tracking
+    parameters, sorts the remaining query parameters and strips trailing
+    slashes from the path.
+    """
+    parts = urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or '').lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    path = parts.path.rstrip('/') or '/'
+    query = sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+    )
+    return urlunsplit((scheme, host, path, urlencode(query), ''))
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over 64-bit integer keys."""
+
+    def __init__(self, capacity: int, error_rate: float = 0.01):
+        self.num_bits = max(8, int(-capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+
+    def _positions(self, key: int):
+        # Double hashing: derive a second independent hash by mixing the key
+        h1 = key & MASK_64
+        h2 = ((h1 ^ (h1 >> 31)) * 0xBF58476D1CE4E5B9 & MASK_64) | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: int):
+        for pos in self._positions(key):
+            self.bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, key: int) -> bool:
+        return all(self.bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(key))
+
+
+class UrlIndex:
+    """Persistent set of canonical URLs for constant-time deduplication.
+
+    URLs are stored as 64-bit hashes of their canonical form in SQLite, so
+    the on-disk index stays small as history grows. An in-memory Bloom
+    filter in front of it answers most "never seen" lookups without
+    touching the database and keeps memory bounded by ``capacity``.
+
+    With ``shared=True`` the index may be written by several processes at
+    once; the Bloom filter cannot see other processes' additions, so every
+    lookup goes to the (indexed) database instead.
+    """
+
+    def __init__(self, path: str, capacity: int = 2_000_000, error_rate: float = 0.01, shared: bool = False):
+        self.path = path
+        self.shared = shared
+        self.conn = sqlite3.connect(path, timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("CREATE TABLE IF NOT EXISTS urls (hash INTEGER PRIMARY KEY)")
+        self.conn.commit()
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.refresh()
+
+    def refresh(self):
+        """Rebuild the Bloom filter from the database, e.g. after other processes added URLs."""
+        self.bloom = BloomFilter(self.capacity, self.error_rate)
+        for (key,) in self.conn.execute("SELECT hash FROM urls"):
+            self.bloom.add(key)
+
+    @staticmethod
+    def _key(url: str) -> int:
+        digest = hashlib.blake2b(canonicalize_url(url).encode('utf-8'), digest_size=8).digest()
+        return int.from_bytes(digest, 'big', signed=True)
+
+    def __contains__(self, url: str) -> bool:
+        key = self._key(url)
+        if not self.shared and key not in self.bloom:
+            return False
+        return self.conn.execute("SELECT 1 FROM urls WHERE hash = ?", (key,)).fetchone() is not None
+
+    def add(self, url: str) -> bool:
+        """Add a URL, returning True if it was not in the index before."""
+        key = self._key(url)
+        cursor = self.conn.execute("INSERT OR IGNORE INTO urls (hash) VALUES (?)", (key,))
+        self.conn.commit()
+        self.bloom.add(key)
+        return cursor.rowcount == 1
+
+    def update(self, urls: Iterable[str]):
+        """Add many URLs in a single transaction."""
+        keys = [self._key(url) for url in urls]
+        with self.conn:
+            self.conn.executemany("INSERT OR IGNORE INTO urls (hash) VALUES (?)", ((key,) for key in keys))
+        for key in keys:
+            self.bloom.add(key)
+
+    def __len__(self) -> int:
+        return self.conn.execute("SELECT COUNT(*) FROM urls").fetchone()[0]
+
+    def close(self):
+        self.conn.close()